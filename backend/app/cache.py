@@ -1,18 +1,56 @@
 # backend/app/cache.py
 
 import redis.asyncio as redis
+import ormsgpack
+import zstandard
 import json
 import logging
-from typing import Optional, Any
+import zlib
+from typing import Optional, Any, Dict, List
 from contextlib import asynccontextmanager
 
 from .config import settings
+from .models import PokemonSummary, PokemonDetail, Generation, PokemonTypeFilter
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 redis_pool = None
 
+# Raw values stored under keys with this suffix are zstd-compressed transparently
+ZSTD_KEY_SUFFIX = ":zstd"
+# Reused across calls; safe here since all access happens on the event loop thread
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+# Leading byte of every msgpack value written by set_cache/set_cache_many.
+# Bump it when the cached layout changes; entries with another prefix read as a miss.
+CACHE_FORMAT_VERSION = b"\x01"
+
+def _schema_fingerprint() -> bytes:
+    """CRC32 of the cached models' JSON schemas, so a change to their shape invalidates old entries."""
+    schemas = [model.model_json_schema() for model in (PokemonSummary, PokemonDetail, Generation, PokemonTypeFilter)]
+    return zlib.crc32(json.dumps(schemas, sort_keys=True).encode()).to_bytes(4, "big")
+
+# Format version + model schema fingerprint; cached dicts are only rebuilt into
+# models (partly via model_construct) when both match what this process writes
+_CACHE_VALUE_PREFIX = CACHE_FORMAT_VERSION + _schema_fingerprint()
+
+def _pack(value: Any) -> bytes:
+    """Serializes a value (pydantic models included) to version-prefixed msgpack bytes."""
+    return _CACHE_VALUE_PREFIX + ormsgpack.packb(value, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+
+def _encode_raw(key: str, value: bytes) -> bytes:
+    """Compresses a raw value if its key carries the zstd suffix."""
+    return _zstd_compressor.compress(value) if key.endswith(ZSTD_KEY_SUFFIX) else value
+
+def shard_key(key: str, refresh_id: str, index: int) -> str:
+    """
+    Builds the Redis key for one shard of a sharded value (shards are always zstd-compressed).
+    Each refresh writes its shards under its own refresh_id, so it never overwrites a set readers may still use.
+    """
+    return f"{key}:shard:{refresh_id}:{index}{ZSTD_KEY_SUFFIX}"
+
 def create_redis_pool():
     """Creates an asynchronous Redis connection pool."""
     global redis_pool
@@ -21,7 +59,7 @@ def create_redis_pool():
         # Using from_url handles parsing the connection string
         redis_pool = redis.ConnectionPool.from_url(
             settings.redis_url,
-            decode_responses=True, # Decode responses to strings automatically
+            decode_responses=False, # Values are msgpack-encoded bytes, see get_cache/set_cache
             max_connections=20     # Adjust max connections as needed
         )
         logger.info("Redis connection pool created successfully.")
@@ -66,6 +104,19 @@ async def get_redis_connection():
         # logger.debug("Redis connection returned to pool (implicitly).")
         pass # Connection is automatically returned to pool when using redis.Redis(connection_pool=...)
 
+def _unpack(key: str, cached_data: bytes) -> Optional[Any]:
+    """Decodes a value written by _pack; outdated or undecodable entries read as None."""
+    if not cached_data.startswith(_CACHE_VALUE_PREFIX):
+        # Written by an older format (e.g. JSON) or model shape; let the caller refetch and overwrite it
+        logger.info(f"Cache entry for key: {key} has an outdated format. Treating as a miss.")
+        return None
+    try:
+        # Data is stored as version-prefixed msgpack bytes
+        return ormsgpack.unpackb(memoryview(cached_data)[len(_CACHE_VALUE_PREFIX):])
+    except ormsgpack.MsgpackDecodeError:
+        logger.warning(f"Failed to decode msgpack from cache for key: {key}. Treating as a miss.")
+        return None
+
 async def get_cache(key: str) -> Optional[Any]:
     """Retrieves data from Redis cache."""
     try:
@@ -73,12 +124,7 @@ async def get_cache(key: str) -> Optional[Any]:
             cached_data = await conn.get(key)
             if cached_data:
                 logger.debug(f"Cache HIT for key: {key}")
-                try:
-                    # Assuming data is stored as JSON string
-                    return json.loads(cached_data)
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to decode JSON from cache for key: {key}. Returning raw data.")
-                    return cached_data # Or return None/raise error? Decide based on need
+                return _unpack(key, cached_data)
             else:
                 logger.debug(f"Cache MISS for key: {key}")
                 return None
@@ -86,28 +132,131 @@ async def get_cache(key: str) -> Optional[Any]:
         logger.error(f"Redis GET error for key '{key}': {e}", exc_info=True)
         return None # Fail gracefully on cache error
 
+async def get_cache_many(keys: List[str]) -> Dict[str, Any]:
+    """
+    Retrieves several msgpack entries with a single MGET.
+    Returns only the keys that were found and decoded.
+    """
+    if not keys:
+        return {}
+    try:
+        async with get_redis_connection() as conn:
+            cached_values = await conn.mget(keys)
+    except redis.RedisError as e:
+        logger.error(f"Redis MGET error for {len(keys)} keys: {e}", exc_info=True)
+        return {} # Fail gracefully on cache error
+
+    found = {}
+    for key, cached_data in zip(keys, cached_values):
+        value = _unpack(key, cached_data) if cached_data else None
+        if value is not None:
+            found[key] = value
+    logger.debug(f"Cache MGET: {len(found)}/{len(keys)} hits")
+    return found
+
 async def set_cache(key: str, value: Any, ttl: int = settings.cache_ttl_seconds):
-    """Stores data in Redis cache with a TTL."""
+    """
+    Stores data in Redis cache with a TTL.
+    Pydantic models (and lists of them) are packed directly, no model_dump() needed.
+    """
     if value is None:
         logger.warning(f"Attempted to cache None value for key: {key}. Skipping.")
         return False
 
     try:
-        # Serialize data to JSON string before storing
-        json_value = json.dumps(value)
-    except (TypeError, OverflowError) as e:
-        logger.error(f"Failed to serialize data to JSON for key '{key}': {e}", exc_info=True)
+        # Serialize data to msgpack bytes before storing (pydantic models are handled natively)
+        packed_value = _pack(value)
+    except (TypeError, OverflowError, ormsgpack.MsgpackEncodeError) as e:
+        logger.error(f"Failed to serialize data to msgpack for key '{key}': {e}", exc_info=True)
         return False # Cannot cache non-serializable data
 
     try:
         async with get_redis_connection() as conn:
-            await conn.setex(key, ttl, json_value)
+            await conn.set(key, packed_value, ex=ttl)
             logger.debug(f"Cache SET for key: {key} with TTL: {ttl}s")
             return True
     except redis.RedisError as e:
         logger.error(f"Redis SET error for key '{key}': {e}", exc_info=True)
         return False # Fail gracefully on cache error
 
+async def set_cache_many(values: Dict[str, Any], ttl: int = settings.cache_ttl_seconds, raw_values: Optional[Dict[str, bytes]] = None):
+    """
+    Stores several entries in one round-trip using a non-transactional pipeline.
+    Entries in `values` are msgpack-encoded like set_cache; entries in `raw_values`
+    are already-serialized bytes, zstd-compressed when their key ends in ZSTD_KEY_SUFFIX.
+    """
+    raw_values = raw_values or {}
+    try:
+        packed_values = {
+            key: _pack(value)
+            for key, value in values.items() if value is not None
+        }
+    except (TypeError, OverflowError, ormsgpack.MsgpackEncodeError) as e:
+        logger.error(f"Failed to serialize data to msgpack for pipelined cache write: {e}", exc_info=True)
+        return False
+
+    if not packed_values and not raw_values:
+        logger.warning("Attempted pipelined cache write with no values. Skipping.")
+        return False
+
+    try:
+        async with get_redis_connection() as conn:
+            async with conn.pipeline(transaction=False) as pipe:
+                for key, value in packed_values.items():
+                    pipe.set(key, value, ex=ttl)
+                for key, value in raw_values.items():
+                    pipe.set(key, _encode_raw(key, value), ex=ttl)
+                await pipe.execute()
+            logger.debug(f"Cache SET (pipelined) for {len(packed_values) + len(raw_values)} keys with TTL: {ttl}s")
+            return True
+    except redis.RedisError as e:
+        logger.error(f"Redis pipelined SET error: {e}", exc_info=True)
+        return False # Fail gracefully on cache error
+
+async def set_cache_shard(key: str, refresh_id: str, index: int, data: bytes, ttl: int = settings.cache_ttl_seconds, values: Optional[Dict[str, Any]] = None):
+    """
+    Stores one serialized shard of `key` in the shard set `refresh_id`, plus any
+    msgpack `values` that belong with it, in a single pipelined round-trip.
+    """
+    return await set_cache_many(values or {}, ttl=ttl, raw_values={shard_key(key, refresh_id, index): data})
+
+async def get_cache_shards(key: str, refresh_id: str, count: int) -> Optional[List[bytes]]:
+    """
+    Retrieves shards 0..count-1 of the shard set `refresh_id` of `key` with a single MGET.
+    Returns None if any shard is missing or cannot be decompressed.
+    """
+    try:
+        async with get_redis_connection() as conn:
+            cached_shards = await conn.mget([shard_key(key, refresh_id, index) for index in range(count)])
+    except redis.RedisError as e:
+        logger.error(f"Redis MGET error for shards of key '{key}': {e}", exc_info=True)
+        return None # Fail gracefully on cache error
+
+    if not all(cached_shards):
+        logger.debug(f"Cache MISS (shards) for key: {key}")
+        return None
+    try:
+        return [_zstd_decompressor.decompress(shard) for shard in cached_shards]
+    except zstandard.ZstdError as e:
+        logger.warning(f"Failed to decompress zstd shard from cache for key: {key}. Error: {e}")
+        return None
+
+async def expire_cache_shards(key: str, refresh_id: str, count: int, ttl: int):
+    """
+    Shortens the TTL of a superseded shard set, so readers that still hold its manifest
+    can finish reading it while the set no longer lingers for the full cache TTL.
+    """
+    try:
+        async with get_redis_connection() as conn:
+            async with conn.pipeline(transaction=False) as pipe:
+                for index in range(count):
+                    pipe.expire(shard_key(key, refresh_id, index), ttl)
+                await pipe.execute()
+            return True
+    except redis.RedisError as e:
+        logger.error(f"Redis EXPIRE error for shards of key '{key}': {e}", exc_info=True)
+        return False
+
 async def clear_cache(key: str):
     """Removes a specific key from the Redis cache."""
     try:
@@ -1,9 +1,9 @@
 # backend/app/config.py
 
 import os
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 # Load environment variables from .env file if it exists
 # Useful for local development
@@ -19,6 +19,9 @@ LOCAL_SPRITE_BASE_PATH: str = "/assets/sprites/"
 
 class Settings(BaseSettings):
     """Application settings."""
+    # Specifies the .env file encoding
+    # If you use a different name for your .env file, add env_file='...' here
+    model_config = SettingsConfigDict(env_file_encoding='utf-8')
 
     # Redis configuration
     # Reads REDIS_URL from environment or .env file
@@ -28,24 +31,59 @@ class Settings(BaseSettings):
     # PokeAPI base URL
     pokeapi_base_url: str = "https://pokeapi.co/api/v2"
 
+    # PokeAPI GraphQL endpoint, used to fetch all Pokémon summaries in one request
+    pokeapi_graphql_url: str = "https://beta.pokeapi.co/graphql/v1beta"
+    # Set to False to always build the summary from per-Pokémon REST requests
+    summary_use_graphql: bool = True
+
+    # Shared PokeAPI HTTP client connection pool
+    # Keep-alive connections are reused across requests to avoid repeated TCP/TLS handshakes
+    pokeapi_max_connections: int = 100
+    pokeapi_max_keepalive_connections: int = 32
+    pokeapi_keepalive_expiry_seconds: float = 60.0
+    # Multiplex concurrent requests over fewer connections (needs the h2 package, see httpx[http2])
+    pokeapi_http2: bool = True
+
     # Default cache TTL (Time To Live) in seconds
     # 30 days = 30 * 24 * 60 * 60 seconds
     cache_ttl_seconds: int = 30 * 24 * 60 * 60 # Default: 30 days
+    # Identifiers PokeAPI answered 404 for are remembered for a shorter time
+    not_found_cache_ttl_seconds: int = 24 * 60 * 60 # Default: 1 day
 
     # Max Pokemon ID to fetch for summary (adjust as new generations are added)
     # Gen 9 ends at 1025 (as of early 2024), let's add some buffer
     max_pokemon_id_to_fetch: int = 1025 # Example: covers up to Paldean Pokémon + some buffer
 
+    # Number of Pokémon summaries fetched concurrently during a summary refresh
+    # Keep this modest to stay within PokeAPI rate limits
+    summary_fetch_concurrency: int = 32
+    # Summaries per cached shard; each block is written to Redis as soon as it is fetched
+    summary_shard_size: int = 64
+
+    # In-process memo in front of Redis for the hottest entries
+    # Entries expire after the TTL (±10% jitter), so other instances' refreshes are picked up eventually
+    memo_detail_max_entries: int = 512
+    memo_ttl_seconds: int = 60 * 60 # 1 hour
+
+    # Pokémon whose details are loaded into the cache at startup (starters, mascots, popular legendaries),
+    # so their first view is a cache hit; set to [] to disable
+    prewarm_detail_ids: List[int] = [
+        1, 4, 7, 25, 133, 143, 149, 150, 151,      # Kanto
+        152, 155, 158, 248, 249, 250,              # Johto
+        252, 255, 258, 384,                        # Hoenn
+        387, 390, 393, 445, 448,                   # Sinnoh
+        495, 498, 501, 650, 653, 656,              # Unova, Kalos
+        722, 725, 728, 810, 813, 816, 906, 909, 912 # Alola, Galar, Paldea
+    ]
+
+    # Skip re-running Python-level validators on data read back from our own cache
+    # (the data was fully validated before it was written)
+    trust_cache_validation: bool = True
+
     # --- Sprite Setting ---
     # Use 'local' to serve from /assets/sprites, 'remote' to use PokeAPI URLs
     sprite_source_mode: Literal['local', 'remote'] = "remote" # Default to remote
 
-    class Config:
-        # Specifies the .env file encoding
-        env_file_encoding = 'utf-8'
-        # If you use a different name for your .env file, specify it here
-        # env_file = '.env'
-
 
 # Create a single instance of the settings to be imported in other modules
 settings = Settings()
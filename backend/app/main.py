@@ -1,21 +1,27 @@
 # backend/app/main.py
 
 from fastapi import FastAPI, HTTPException, Path, Query, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from typing import List, Optional, Union
 import time
 
+from pydantic import TypeAdapter
+
 # Import necessary components from other modules
-from .cache import create_redis_pool, close_redis_pool, redis_pool, clear_cache
+from .cache import create_redis_pool, close_redis_pool, redis_pool, clear_cache, get_redis_connection
 from .pokeapi_client import close_client, get_client
 from .pokedex_data import (
     get_pokedex_summary_data,
+    get_pokemon_summary_data,
     get_pokemon_detail_data,
+    get_pokemon_details_bulk,
     get_all_generations_data,
     get_all_types_data,
     POKEDEX_SUMMARY_CACHE_KEY, # Import cache keys if needed for management endpoints
+    POKEDEX_SUMMARY_MANIFEST_KEY,
     GENERATIONS_CACHE_KEY,
     TYPES_CACHE_KEY,
     POKEMON_DETAIL_CACHE_PREFIX
@@ -31,35 +37,29 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 IS_REFRESHING: bool = False
 MAINTENANCE_MESSAGE = "Pokedex data is currently being refreshed to bring you the latest info. Please try again in a few moments."
 
-# Lifespan context manager (from Step 2)
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    global IS_REFRESHING # Declare intent to modify global variable
-    
-    # Startup phase
-    logger.info("Application startup...")
-    try:
-        create_redis_pool()
-        logger.info("Redis connection pool created.")
-        # You could add a ping check here if desired
-        # async with get_redis_connection() as conn:
-        #    await conn.ping()
-        # logger.info("Redis ping successful.")
-    except Exception as e:
-        logger.error(f"Failed to initialize Redis during startup: {e}", exc_info=True)
-        # Decide if the app should fail to start if Redis is unavailable
-        # raise RuntimeError("Could not connect to Redis") from e
+_warmup_task: Optional[asyncio.Task] = None
 
-    _ = await get_client()
-    logger.info("HTTPX client initialized.")
+# Upper bound on identifiers per bulk detail request (each miss costs two PokeAPI calls)
+MAX_BULK_DETAIL_IDS = 50
+# Encode whole response lists to JSON bytes in one pydantic-core pass
+_DETAIL_LIST_ADAPTER = TypeAdapter(List[PokemonDetail])
+_GENERATION_LIST_ADAPTER = TypeAdapter(List[Generation])
+_TYPE_LIST_ADAPTER = TypeAdapter(List[PokemonTypeFilter])
+
+async def warm_essential_caches():
+    """
+    Populates the summary, generations and types caches if any of them is missing.
+    Parts already present in Redis are served from cache, so a second instance
+    starting against a warm Redis does no PokeAPI work.
+    """
+    global IS_REFRESHING # Declare intent to modify global variable
 
-    # --- Simplified Startup Cache Population (Only if MISSING) ---
     logger.info("Checking if essential caches exist...")
     needs_population = False
     try:
         # Primarily check if the summary key exists at all
         async with get_redis_connection() as conn: # Use cache.py utility
-             summary_exists = await conn.exists(POKEDEX_SUMMARY_CACHE_KEY)
+             summary_exists = await conn.exists(POKEDEX_SUMMARY_MANIFEST_KEY)
              # Optionally check others too
              gens_exist = await conn.exists(GENERATIONS_CACHE_KEY)
              types_exist = await conn.exists(TYPES_CACHE_KEY)
@@ -74,27 +74,83 @@ async def lifespan(app: FastAPI):
          logger.error(f"Error checking cache existence during startup: {e}", exc_info=True)
          needs_population = True # Assume population needed if check fails
          logger.warning("Assuming cache population needed due to error during check.")
-    
+
     if needs_population:
         IS_REFRESHING = True
         logger.warning("CACHE POPULATION STARTING (startup): Populating missing essential data.")
         try:
-            # Fetch everything needed if any part is missing
-            await get_pokedex_summary_data(force_refresh=True)
-            await get_all_generations_data(force_refresh=True)
-            await get_all_types_data(force_refresh=True)
+            # force_refresh=False: only the missing parts are fetched from PokeAPI,
+            # and the three populations run concurrently
+            results = await asyncio.gather(
+                get_pokedex_summary_data(force_refresh=False, raw=True),
+                get_all_generations_data(force_refresh=False),
+                get_all_types_data(force_refresh=False),
+                return_exceptions=True
+            )
+            for name, result in zip(("summary", "generations", "types"), results):
+                if isinstance(result, Exception):
+                    logger.error(f"CACHE POPULATION FAILED (startup) for {name}: {result}", exc_info=result)
+                elif result is None:
+                    logger.error(f"CACHE POPULATION FAILED (startup) for {name}: no data returned.")
             logger.info("CACHE POPULATION COMPLETED (startup).")
         except Exception as e:
             logger.error(f"CACHE POPULATION FAILED (startup): {e}", exc_info=True)
         finally:
             IS_REFRESHING = False
             logger.info("Refresh flag reset after startup population attempt.")
-    # --- End Startup Cache Population ---
+
+async def prewarm_popular_details():
+    """
+    Loads the details of the Pokémon in settings.prewarm_detail_ids into the cache.
+    Goes through the bulk path, so already-cached entries cost a single MGET.
+    """
+    if not settings.prewarm_detail_ids:
+        return
+    start_time = time.perf_counter()
+    try:
+        details = await get_pokemon_details_bulk([str(pokemon_id) for pokemon_id in settings.prewarm_detail_ids])
+        logger.info(f"Pre-warmed {len(details)}/{len(settings.prewarm_detail_ids)} popular Pokémon details in {time.perf_counter() - start_time:.2f}s.")
+    except Exception as e:
+        logger.error(f"Pre-warming popular Pokémon details failed: {e}", exc_info=True)
+
+async def run_startup_warmup():
+    """Warms the essential caches, then the popular details (after, so PokeAPI is not hit by both at once)."""
+    await warm_essential_caches()
+    await prewarm_popular_details()
+
+# Lifespan context manager (from Step 2)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _warmup_task
+
+    # Startup phase
+    logger.info("Application startup...")
+    try:
+        create_redis_pool()
+        logger.info("Redis connection pool created.")
+        # You could add a ping check here if desired
+        # async with get_redis_connection() as conn:
+        #    await conn.ping()
+        # logger.info("Redis ping successful.")
+    except Exception as e:
+        logger.error(f"Failed to initialize Redis during startup: {e}", exc_info=True)
+        # Decide if the app should fail to start if Redis is unavailable
+        # raise RuntimeError("Could not connect to Redis") from e
+
+    _ = await get_client()
+    logger.info("HTTPX client initialized.")
+
+    # --- Background Cache Warm-up ---
+    # Runs as a task so startup is not blocked by a cold-cache population
+    _warmup_task = asyncio.create_task(run_startup_warmup())
 
     yield # Application runs here
 
     # Shutdown phase
     logger.info("Application shutdown...")
+    if _warmup_task and not _warmup_task.done():
+        _warmup_task.cancel()
+        logger.info("Cancelled unfinished cache warm-up task.")
     await close_redis_pool()
     await close_client()
     logger.info("Resources cleaned up.")
@@ -152,17 +208,62 @@ async def get_pokedex_summary(
 ):
     """
     Retrieves the cached or freshly fetched summary data for all Pokémon.
+    The cached JSON bytes are returned as-is, without rehydrating the models.
     """
     logger.info(f"Received request for Pokedex summary. force_refresh={force_refresh}")
-    summary_data = await get_pokedex_summary_data(force_refresh=force_refresh)
-    if summary_data is None:
+    summary_json = await get_pokedex_summary_data(force_refresh=force_refresh, raw=True)
+    if summary_json is None:
         logger.error("Failed to retrieve Pokedex summary data.")
         raise HTTPException(
             status_code=500,
             detail="Could not retrieve Pokedex summary data. The external API might be down or data aggregation failed."
         )
-    logger.info(f"Returning {len(summary_data)} Pokémon summaries.")
-    return summary_data
+    logger.info(f"Returning Pokémon summaries ({len(summary_json)} bytes).")
+    return Response(content=summary_json, media_type="application/json")
+
+@app.get(
+    "/api/pokedex/summary/{pokemon_id}",
+    response_model=PokemonSummary,
+    summary="Get Summarized Data for a Specific Pokémon",
+    description="Returns the summary (ID, Name, Generation, Types, Sprite, Flags) of a single Pokémon. Cheaper than the detail endpoint for list views. Data is cached.",
+    tags=["Pokedex"]
+)
+async def get_pokemon_summary(
+    pokemon_id: int = Path(..., ge=1, description="The National Pokédex ID of the Pokémon.", examples=[25])
+):
+    """
+    Retrieves the cached or freshly fetched summary for a single Pokémon.
+    """
+    logger.info(f"Received request for Pokémon summary: {pokemon_id}")
+    pokemon_summary = await get_pokemon_summary_data(pokemon_id)
+    if pokemon_summary is None:
+        logger.warning(f"Pokémon summary not found for ID: {pokemon_id}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Pokémon with ID '{pokemon_id}' not found."
+        )
+    return Response(content=pokemon_summary.model_dump_json(), media_type="application/json")
+
+@app.get(
+    "/api/pokemon/bulk",
+    response_model=List[PokemonDetail],
+    summary="Get Detailed Data for Several Pokémon",
+    description=f"Returns detailed information for up to {MAX_BULK_DETAIL_IDS} Pokémon identified by ID or name, in request order. Identifiers that are not found are omitted. Data is cached.",
+    tags=["Pokemon"]
+)
+async def get_pokemon_details_batch(
+    ids: List[str] = Query(..., description="National Pokédex IDs or names (lowercase). Repeat the parameter for each Pokémon.", examples=[["1", "pikachu"]])
+):
+    """
+    Retrieves the cached or freshly fetched details for several Pokémon at once,
+    using one Redis read for all cached entries.
+    """
+    if len(ids) > MAX_BULK_DETAIL_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_DETAIL_IDS} ids can be requested at once.")
+    identifiers = [identifier.lower() for identifier in ids]
+    logger.info(f"Received bulk request for {len(identifiers)} Pokémon details.")
+    details = await get_pokemon_details_bulk(identifiers)
+    return Response(content=_DETAIL_LIST_ADAPTER.dump_json(details), media_type="application/json")
 
 @app.get(
     "/api/pokemon/{pokemon_id_or_name}",
@@ -196,7 +297,9 @@ async def get_pokemon_details(
             detail=f"Pokémon with ID or name '{identifier}' not found."
         )
     logger.info(f"Returning details for Pokémon: {pokemon_data.name} (ID: {pokemon_data.id})")
-    return pokemon_data
+    # Serialized straight to JSON bytes by pydantic-core; returning the model would make
+    # FastAPI re-validate it against response_model and build an intermediate dict
+    return Response(content=pokemon_data.model_dump_json(), media_type="application/json")
 
 @app.get(
     "/api/generations",
@@ -220,7 +323,7 @@ async def get_generations(
             detail="Could not retrieve Pokémon generations data."
         )
     logger.info(f"Returning {len(generations)} generations.")
-    return generations
+    return Response(content=_GENERATION_LIST_ADAPTER.dump_json(generations), media_type="application/json")
 
 @app.get(
     "/api/types",
@@ -244,7 +347,7 @@ async def get_types(
             detail="Could not retrieve Pokémon types data."
         )
     logger.info(f"Returning {len(types)} types.")
-    return types
+    return Response(content=_TYPE_LIST_ADAPTER.dump_json(types), media_type="application/json")
 
 
 # --- Management Endpoint (Optional) ---
@@ -275,7 +378,8 @@ async def trigger_cache_refresh(
     try:
         # Use force_refresh=True within the data fetching functions
         if cache_key == POKEDEX_SUMMARY_CACHE_KEY:
-            result = await get_pokedex_summary_data(force_refresh=True)
+            # raw=True: only success matters here, so skip building the model list
+            result = await get_pokedex_summary_data(force_refresh=True, raw=True)
             refreshed = result is not None
         elif cache_key == GENERATIONS_CACHE_KEY:
             result = await get_all_generations_data(force_refresh=True)
@@ -323,4 +427,4 @@ async def trigger_cache_refresh(
 #    import uvicorn
 #    # Note: reload=True might cause issues with lifespan startup/shutdown logic
 #    # Use reload only for development convenience, disable for stability testing
-#    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=False, lifespan="on")
\ No newline at end of file
+#    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=False, lifespan="on", loop="uvloop")
\ No newline at end of file
@@ -1,19 +1,51 @@
 # backend/app/models.py
 import logging
 
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field, model_validator, validator
 from typing import List, Optional, Any
 
 from .config import settings, POKEAPI_SPRITE_BASE_URL, LOCAL_SPRITE_BASE_PATH # Import settings & constants
 
 logger = logging.getLogger(__name__)
 
+# Shared by the models built in bulk (summary list, detail, filters): instances are never
+# mutated after validation, and unknown keys from PokeAPI/cache are dropped
+_IMMUTABLE_MODEL_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
+# Sprite source mode used by PokemonSprites validation, read once instead of per instance.
+# Call reload_sprite_config() after changing settings.sprite_source_mode at runtime
+_SPRITE_MODE = settings.sprite_source_mode
+
+def reload_sprite_config():
+    """Re-reads the sprite source mode from settings."""
+    global _SPRITE_MODE
+    _SPRITE_MODE = settings.sprite_source_mode
+
+def _local_sprite_url(url: Optional[str], _remote_base: str = POKEAPI_SPRITE_BASE_URL,
+                      _remote_base_len: int = len(POKEAPI_SPRITE_BASE_URL), _local_base: str = LOCAL_SPRITE_BASE_PATH) -> Optional[str]:
+    """
+    Maps a PokeAPI sprite URL to its local path; any other value is returned as is.
+    The base paths are bound as default arguments, so the per-URL checks only read locals.
+    """
+    if url and url.startswith(_remote_base):
+        # Replace base URL with local path base
+        # Example: https://.../master/sprites/pokemon/1.png -> /assets/sprites/sprites/pokemon/1.png
+        return _local_base + url[_remote_base_len:] # Prefix already checked, so slice it off
+    if url and not url.startswith(('/', 'http')):
+        # Handle cases where a relative path might already exist unexpectedly? Optional.
+        logger.warning(f"Sprite URL '{url}' is not absolute. Skipping transformation.")
+    return url
+
 class PokemonType(BaseModel):
     """Represents a Pokémon type."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     name: str = Field(..., description="Name of the type")
 
 class PokemonSummary(BaseModel):
     """Summary data for a Pokémon, for list views and filtering."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     id: int = Field(..., description="Pokémon ID")
     name: str = Field(..., description="Pokémon name")
     generation_id: int = Field(..., description="Generation ID")
@@ -26,103 +58,76 @@ class PokemonSummary(BaseModel):
 
 class PokemonAbility(BaseModel):
     """Represents a Pokémon ability with minimal details for detail view."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     name: str = Field(..., description="Name of the ability")
     url: str = Field(..., description="URL to ability details on PokeAPI") # Optional: could be used for future features
     is_hidden: bool = Field(False, description="Is this a hidden ability")
 
 class PokemonStat(BaseModel):
     """Represents a base stat for a Pokémon."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     name: str = Field(..., description="Name of the stat (e.g., 'hp', 'attack')")
     base_stat: int = Field(..., description="Base stat value")
 
+# Where PokeAPI nests the animated (Gen V Black/White) sprites
+_ANIMATED_SPRITES_PATH = ('versions', 'generation-v', 'black-white', 'animated')
+
+def _sprite_alias(field_name: str, *path: str) -> AliasChoices:
+    """Accepts a sprite under its own name (cached data) or at its nested path in raw PokeAPI data."""
+    return AliasChoices(field_name, AliasPath(*path))
+
 class PokemonSprites(BaseModel):
     """Sprites for a Pokémon, including official artwork and game sprites."""
-    # Existing static sprites
+    # Not frozen: transform_urls_if_local assigns the rewritten URLs after validation
+
+    # Static sprites shown in the detail gallery
     front_default: Optional[str] = None
     back_default: Optional[str] = None
     front_shiny: Optional[str] = None
     back_shiny: Optional[str] = None
     front_female: Optional[str] = None # Add female variants
-    back_female: Optional[str] = None
     front_shiny_female: Optional[str] = None
-    back_shiny_female: Optional[str] = None
-
-    # Official Artwork (extracted via validator)
-    official_artwork: Optional[str] = Field(None, description="URL for official artwork sprite")
-
-    # Animated Sprites (will be populated by root_validator)
-    animated_front_default: Optional[str] = None
-    animated_back_default: Optional[str] = None
-    animated_front_shiny: Optional[str] = None
-    animated_back_shiny: Optional[str] = None
-    animated_front_female: Optional[str] = None # Just in case they add these later
-    animated_back_female: Optional[str] = None
-    animated_front_shiny_female: Optional[str] = None
-    animated_back_shiny_female: Optional[str] = None
-
-    @root_validator(pre=True)
-    def extract_nested_sprites(cls, values: dict):
-        """
-        Extracts deeply nested sprites (official artwork, animated)
-        and adds them to the top level for easier field assignment.
-        Runs before individual field validation.
-        """
-        if not isinstance(values, dict): # Handle case where input isn't a dict
-            return values
-
-        # Extract Official Artwork
-        official_artwork_url = values.get('other', {}).get('official-artwork', {}).get('front_default')
-        if official_artwork_url:
-            values['official_artwork'] = official_artwork_url # Add to dict for field assignment
-
-        # Extract Animated Sprites (Gen V Black/White)
-        try:
-            animated_sprites = values.get('versions', {}).get('generation-v', {}).get('black-white', {}).get('animated', {})
-            if animated_sprites: # Check if animated dict exists and is not None
-                 values['animated_front_default'] = animated_sprites.get('front_default')
-                 values['animated_back_default'] = animated_sprites.get('back_default')
-                 values['animated_front_shiny'] = animated_sprites.get('front_shiny')
-                 values['animated_back_shiny'] = animated_sprites.get('back_shiny')
-                 values['animated_front_female'] = animated_sprites.get('front_female') # Get if exists
-                 values['animated_back_female'] = animated_sprites.get('back_female')
-                 values['animated_front_shiny_female'] = animated_sprites.get('front_shiny_female')
-                 values['animated_back_shiny_female'] = animated_sprites.get('back_shiny_female')
-        except Exception as e:
-            # Log potential errors during complex extraction, but don't fail validation
-            logger.warning(f"Could not extract animated sprites: {e}", exc_info=False) # Set exc_info=False to avoid clutter
-
-        return values
+
+    # Official Artwork, read from its nested PokeAPI path
+    official_artwork: Optional[str] = Field(
+        None, validation_alias=_sprite_alias('official_artwork', 'other', 'official-artwork', 'front_default'),
+        description="URL for official artwork sprite"
+    )
+
+    # Animated Sprites (Gen V Black/White), read from their nested PokeAPI paths
+    # Only the variants the gallery renders; the back/female animations are never displayed
+    animated_front_default: Optional[str] = Field(None, validation_alias=_sprite_alias('animated_front_default', *_ANIMATED_SPRITES_PATH, 'front_default'))
+    animated_front_shiny: Optional[str] = Field(None, validation_alias=_sprite_alias('animated_front_shiny', *_ANIMATED_SPRITES_PATH, 'front_shiny'))
 
     @validator("*", pre=True, allow_reuse=True)
     def ensure_https_url(cls, value):
         """Ensure sprite URLs are HTTPS for security and browser compatibility."""
         if isinstance(value, str) and value.startswith("http://"):
-            return value.replace("http://", "https://", 1) # Replace only the first occurrence
+            return "https://" + value[7:] # Prefix already checked; slicing skips replace's scan of the URL
         return value
     
-    # --- Post-validation Root Validator for URL Transformation ---
-    @root_validator(skip_on_failure=True) # Use default post=True, skip if pre-validators fail
-    def transform_urls_if_local(cls, values: dict):
-        if settings.sprite_source_mode == 'local':
+    # --- Post-validation Model Validator for URL Transformation ---
+    @model_validator(mode='after') # Runs on the built instance, only if field validation succeeded
+    def transform_urls_if_local(self) -> 'PokemonSprites':
+        if _SPRITE_MODE == 'local':
             logger.debug(f"Transforming sprite URLs to local paths. Base: {LOCAL_SPRITE_BASE_PATH}")
-            for key, url in values.items():
-                if isinstance(url, str) and url.startswith(POKEAPI_SPRITE_BASE_URL):
-                    # Replace base URL with local path base
-                    # Example: https://.../master/sprites/pokemon/1.png -> /assets/sprites/sprites/pokemon/1.png
-                    relative_path = url.removeprefix(POKEAPI_SPRITE_BASE_URL)
-                    values[key] = f"{LOCAL_SPRITE_BASE_PATH}{relative_path}"
-                elif isinstance(url, str) and not url.startswith(('/', 'http')):
-                     # Handle cases where a relative path might already exist unexpectedly? Optional.
-                     logger.warning(f"Sprite URL '{url}' for key '{key}' is not absolute. Skipping transformation.")
-        # Else (mode is remote), return values unchanged
-        return values
-    
-    class Config:
-         # Add configuration if needed, e.g., validate_assignment=True if modifying fields directly
-         pass # Keep empty or add as needed
+            for key in _SPRITE_URL_FIELDS:
+                url = getattr(self, key)
+                local_url = _local_sprite_url(url)
+                if local_url is not url: # Only assign fields that actually changed
+                    setattr(self, key, local_url)
+        # Else (mode is remote), the instance is returned unchanged
+        return self
+
+# Every PokemonSprites field holds a sprite URL
+_SPRITE_URL_FIELDS = frozenset(PokemonSprites.model_fields)
 
 class PokemonDetail(BaseModel):
     """Detailed data for a single Pokémon."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     id: int = Field(..., description="Pokémon ID")
     name: str = Field(..., description="Pokémon name")
     genus: str = Field(..., description="Species genus (e.g., Seed Pokémon)")
@@ -140,7 +145,7 @@ class PokemonDetail(BaseModel):
     evolution_chain_url: Optional[str] = Field(..., description="URL to evolution chain data")
     evolves_from_species: Optional[dict] = Field(None, description="The Pokémon species that evolves into this Pokemon_species")
     flavor_text_entries: List[dict] = Field(..., description="List of flavor text entries (descriptions)") 
-    gender_rate: int = Field(..., description="Gender rate (for breeding info)") # -1 genderless, 0 male only, 8 female only, 1-7 ratio
+    gender_rate: int = Field(..., ge=-1, le=8, description="Gender rate (for breeding info)") # -1 genderless, 0 male only, 8 female only, 1-7 ratio
     egg_groups: List[dict] = Field(..., description="List of egg groups") 
     habitat: Optional[str] = Field(None, description="Habitat name, if any") 
     is_baby: Optional[bool] = Field(False, description="Whether it's a baby Pokémon") 
@@ -149,8 +154,8 @@ class PokemonDetail(BaseModel):
     has_gender_differences: bool = Field(False, description="Whether Pokémon has visual gender differences") 
     shape: Optional[str] = Field(None, description="Pokémon shape name") 
     growth_rate_name: Optional[str] = Field(None, description="Growth rate name") 
-    capture_rate: Optional[int] = Field(None, alias='capture_rate', description="Base capture rate; up to 255")
-    base_happiness: Optional[int] = Field(None, description="The happiness when caught by a normal Pokéball; up to 255") 
+    capture_rate: Optional[int] = Field(None, alias='capture_rate', ge=0, le=255, description="Base capture rate; up to 255")
+    base_happiness: Optional[int] = Field(None, ge=0, le=255, description="The happiness when caught by a normal Pokéball; up to 255") 
     hatch_counter: Optional[int] = Field(None, description="Cycles required to hatch, used for step calculation") 
 
     @validator("genus", pre=True, allow_reuse=True)
@@ -213,18 +218,19 @@ class PokemonDetail(BaseModel):
         # return value # Assuming already extracted name is passed
         # Safest: Expect the extracted name string or None
         return value if isinstance(value, str) else None
-    
-    class Config:
-        populate_by_name = True # Important: Allows using 'alias' and field names
 
 class Generation(BaseModel):
     """Represents a Pokemon Generation for filter options."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     id: int = Field(..., description="Generation ID (1-9)")
     name: str = Field(..., description="Generation Name (e.g., generation-i)")
     region_name: str = Field(..., description="Main region name for this generation (e.g., kanto)")
 
 class PokemonTypeFilter(BaseModel):
     """Represents a Pokemon Type for filter options."""
+    model_config = _IMMUTABLE_MODEL_CONFIG
+
     name: str = Field(..., description="Type Name (e.g., fire)")
 
 # Example usage (for testing models):
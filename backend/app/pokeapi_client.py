@@ -2,7 +2,9 @@
 
 import httpx
 import logging
-from typing import Optional, Dict, Any
+from pydantic_core import from_json
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
 
 from .config import settings
 
@@ -11,18 +13,39 @@ logger = logging.getLogger(__name__)
 # Base URL for PokeAPI
 BASE_URL = settings.pokeapi_base_url
 
-# Create a reusable async HTTP client instance
+# Reusable async HTTP client instance, created once and shared by all fetches
 # Recommended practice for performance (connection pooling)
-# Set reasonable timeouts
-_client = httpx.AsyncClient(
-    base_url=BASE_URL,
-    timeout=httpx.Timeout(10.0, connect=5.0), # 10s total timeout, 5s connect timeout
-    follow_redirects=True,
-    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20) # Adjust limits as needed
-)
+_client: Optional[httpx.AsyncClient] = None
+
+# (ETag, raw body) of responses fetched with revalidate=True, keyed by URL.
+# Only the small, effectively immutable list/generation endpoints opt in, so this stays tiny.
+# The body is kept as bytes and parsed on every reuse, so no caller can mutate a shared dict
+_etag_cache: Dict[str, Tuple[str, bytes]] = {}
+
+# Returned by fetch_pokeapi(..., report_not_found=True) when PokeAPI answers 404, so callers
+# can tell a missing resource from a failed request. Empty and read-only, so `not data` still holds
+NOT_FOUND: Mapping[str, Any] = MappingProxyType({})
+
+def _create_client() -> httpx.AsyncClient:
+    """Builds the pooled httpx AsyncClient used for all PokeAPI requests."""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=httpx.Timeout(10.0, connect=5.0), # 10s total timeout, 5s connect timeout
+        follow_redirects=True,
+        http2=settings.pokeapi_http2, # Concurrent fetches share connections instead of opening one each
+        limits=httpx.Limits(
+            max_connections=settings.pokeapi_max_connections,
+            max_keepalive_connections=settings.pokeapi_max_keepalive_connections,
+            keepalive_expiry=settings.pokeapi_keepalive_expiry_seconds
+        )
+    )
 
 async def get_client() -> httpx.AsyncClient:
-    """Returns the shared httpx AsyncClient instance."""
+    """Returns the shared httpx AsyncClient instance, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+        logger.info("HTTPX client created.")
     return _client
 
 async def close_client():
@@ -36,17 +59,23 @@ async def close_client():
         except Exception as e:
             logger.error(f"Error closing HTTPX client: {e}", exc_info=True)
 
-async def fetch_pokeapi(endpoint: str) -> Optional[Dict[str, Any]]:
+async def fetch_pokeapi(endpoint: str, client: Optional[httpx.AsyncClient] = None, revalidate: bool = False, report_not_found: bool = False) -> Optional[Dict[str, Any]]:
     """
     Fetches data from a specific PokeAPI endpoint.
 
     Args:
         endpoint: The API endpoint path (e.g., "/pokemon/pikachu" or full URL if needed).
+        client: Client to use; fan-out callers pass the one they already hold.
+                Defaults to the shared client.
+        revalidate: Remember the response ETag and send it as If-None-Match next time;
+                    a 304 Not Modified then reuses the stored body without downloading it.
+        report_not_found: Return NOT_FOUND instead of None when the resource does not exist.
 
     Returns:
         A dictionary containing the JSON response, or None if an error occurs.
     """
-    client = await get_client()
+    if client is None:
+        client = await get_client()
     url = endpoint # Assumes endpoint includes leading slash or is a full URL
     if not endpoint.startswith("http"):
         # Ensure relative endpoints start correctly or handle base URL logic
@@ -55,11 +84,19 @@ async def fetch_pokeapi(endpoint: str) -> Optional[Dict[str, Any]]:
         url = f"{BASE_URL}{endpoint}" # Use configured base URL if relative
 
     logger.debug(f"Fetching data from PokeAPI: {url}")
+    cached = _etag_cache.get(url) if revalidate else None
     try:
-        response = await client.get(url)
+        response = await client.get(url, headers={"If-None-Match": cached[0]} if cached else None)
+        if cached and response.status_code == 304:
+            logger.debug(f"PokeAPI resource not modified, reusing stored body for {url}")
+            return from_json(cached[1])
         response.raise_for_status() # Raise an exception for 4xx or 5xx status codes
         logger.debug(f"Successfully fetched data from {url}, status: {response.status_code}")
-        return response.json()
+        data = from_json(response.content) # pydantic-core's Rust parser; faster than response.json()'s stdlib json
+        etag = response.headers.get("ETag")
+        if revalidate and etag:
+            _etag_cache[url] = (etag, response.content)
+        return data
     except httpx.TimeoutException:
         logger.error(f"Request timed out for PokeAPI endpoint: {url}")
         return None
@@ -71,12 +108,51 @@ async def fetch_pokeapi(endpoint: str) -> Optional[Dict[str, Any]]:
         # You might want to handle specific statuses differently (e.g., 404 Not Found)
         if e.response.status_code == 404:
             logger.warning(f"Resource not found at {e.request.url!r}")
+            if report_not_found:
+                return NOT_FOUND
         return None
     except Exception as e:
         # Catch any other unexpected errors
         logger.error(f"An unexpected error occurred during PokeAPI fetch for {url}: {e}", exc_info=True)
         return None
 
+async def fetch_pokeapi_graphql(query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Runs a query against the PokeAPI GraphQL endpoint.
+
+    Args:
+        query: The GraphQL query document.
+        variables: Values for the variables declared in the query.
+
+    Returns:
+        The `data` object of the response, or None if the request or query failed.
+    """
+    client = await get_client()
+    url = settings.pokeapi_graphql_url
+    logger.debug(f"Querying PokeAPI GraphQL: {url}")
+    try:
+        # Bulk queries return a large payload, so allow more time than REST fetches
+        response = await client.post(url, json={"query": query, "variables": variables or {}}, timeout=60.0)
+        response.raise_for_status()
+        body = from_json(response.content)
+        if body.get("errors"):
+            logger.error(f"PokeAPI GraphQL query returned errors: {body['errors']}")
+            return None
+        return body.get("data")
+    except httpx.TimeoutException:
+        logger.error(f"Request timed out for PokeAPI GraphQL endpoint: {url}")
+        return None
+    except httpx.RequestError as e:
+        logger.error(f"An error occurred while requesting {e.request.url!r}: {e}")
+        return None
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP error occurred: {e.response.status_code} {e.response.reason_phrase} for url {e.request.url!r}")
+        return None
+    except Exception as e:
+        # Catch any other unexpected errors (e.g., invalid JSON)
+        logger.error(f"An unexpected error occurred during PokeAPI GraphQL query: {e}", exc_info=True)
+        return None
+
 # Example Usage (for testing within this module)
 # async def main():
 #     # Example: Fetch Bulbasaur data
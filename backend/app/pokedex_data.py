@@ -1,51 +1,176 @@
 # backend/app/pokedex_data.py
 
+import json
 import logging
-from typing import List, Optional
-from functools import lru_cache # Consider using Redis cache instead of in-memory lru_cache if needed across instances
+import operator
+import random
+import uuid
+from collections import defaultdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 import asyncio
 
-from .pokeapi_client import fetch_pokeapi
-from .cache import get_cache, set_cache, clear_cache
-from .config import settings
-from .models import PokemonSummary, PokemonDetail, PokemonType, Generation, PokemonTypeFilter, PokemonAbility, PokemonStat
+from cachetools import TLRUCache
+from pydantic import TypeAdapter
+
+import httpx
+
+from .pokeapi_client import fetch_pokeapi, fetch_pokeapi_graphql, get_client, NOT_FOUND
+from .cache import get_cache, get_cache_many, set_cache, clear_cache, set_cache_many, set_cache_shard, get_cache_shards, expire_cache_shards
+from .config import settings, POKEAPI_SPRITE_BASE_URL
+from .models import PokemonSummary, PokemonDetail, PokemonType, Generation, PokemonTypeFilter, PokemonAbility, PokemonStat, PokemonSprites
 
 logger = logging.getLogger(__name__)
 
 POKEDEX_SUMMARY_CACHE_KEY = "pokedex_summary_data"
+# The summary JSON is stored as shards of POKEDEX_SUMMARY_CACHE_KEY; each refresh writes
+# its own shard set, and the manifest (written last) names the current set and its size
+POKEDEX_SUMMARY_MANIFEST_KEY = f"{POKEDEX_SUMMARY_CACHE_KEY}:manifest"
+# A superseded shard set stays readable this long for readers that fetched the old manifest
+SUPERSEDED_SUMMARY_SHARDS_TTL_SECONDS = 5 * 60
 POKEMON_DETAIL_CACHE_PREFIX = "pokemon_detail_"
+POKEMON_SUMMARY_CACHE_PREFIX = "pokemon_summary_"
+# Marks identifiers PokeAPI has no Pokémon for (negative cache, see _remember_not_found)
+POKEMON_NOT_FOUND_CACHE_PREFIX = "pokemon_not_found_"
 GENERATIONS_CACHE_KEY = "generations_data"
 TYPES_CACHE_KEY = "types_data"
 
-async def _fetch_pokemon_summary(pokemon_id: int) -> Optional[PokemonSummary]:
-    """Fetches and processes summary data for a single Pokémon from PokeAPI, including sprite."""
-    pokemon_data = await fetch_pokeapi(f"/pokemon/{pokemon_id}")
+# PokeAPI generation names (e.g., 'generation-ix') mapped to their integer IDs.
+# Seeded with the known generations; generations PokeAPI adds later are learned
+# from the generations data (see _remember_generation_ids).
+_GEN_ID_BY_NAME: Dict[str, int] = {
+    f"generation-{roman}": gen_id
+    for gen_id, roman in enumerate(["i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix"], 1)
+}
+
+# Raw PokeAPI fields read when building a PokemonDetail, fetched in one C-level call each
+_SPECIES_DETAIL_GETTER = operator.itemgetter(
+    'habitat', 'shape', 'growth_rate', 'gender_rate', 'capture_rate', 'base_happiness',
+    'hatch_counter', 'is_legendary', 'is_mythical', 'is_baby', 'has_gender_differences',
+    'egg_groups', 'evolves_from_species', 'flavor_text_entries', 'genera', 'generation',
+    'evolution_chain',
+)
+_POKEMON_DETAIL_GETTER = operator.itemgetter(
+    'types', 'abilities', 'stats', 'height', 'weight', 'base_experience', 'sprites',
+)
+
+# PokemonType is frozen and PokeAPI has only ~20 types, so every model shares one instance per name
+_POKEMON_TYPES: Dict[str, PokemonType] = {}
+
+def _pokemon_type(name: str) -> PokemonType:
+    """Returns the shared PokemonType instance for a type name."""
+    pokemon_type = _POKEMON_TYPES.get(name)
+    if pokemon_type is None:
+        pokemon_type = _POKEMON_TYPES[name] = PokemonType(name=name)
+    return pokemon_type
+
+def _none() -> None:
+    """defaultdict factory so missing PokeAPI keys read as None."""
+    return None
+
+# List adapters validate/serialize whole cached lists in one pydantic-core call
+_SUMMARY_LIST_ADAPTER = TypeAdapter(List[PokemonSummary])
+_GENERATION_LIST_ADAPTER = TypeAdapter(List[Generation])
+_TYPE_LIST_ADAPTER = TypeAdapter(List[PokemonTypeFilter])
+
+# All summary fields for every default-form Pokémon in a single GraphQL request
+_GRAPHQL_SUMMARY_QUERY = """
+query pokedexSummary($max: Int!) {
+  pokemon_v2_pokemon(where: {id: {_lte: $max}}, order_by: {id: asc}) {
+    id
+    name
+    pokemon_v2_pokemontypes(order_by: {slot: asc}) { pokemon_v2_type { name } }
+    pokemon_v2_pokemonspecy { is_legendary is_mythical is_baby pokemon_v2_generation { name } }
+    pokemon_v2_pokemonsprites { sprites }
+  }
+}
+"""
+
+# Caps in-flight summary fetches. Each one issues two PokeAPI requests, so the cap is
+# kept within half the HTTP pool; otherwise requests would just queue for a connection
+_SUMMARY_FETCH_LIMIT = max(1, min(settings.summary_fetch_concurrency, settings.pokeapi_max_connections // 2))
+_summary_fetch_semaphore = asyncio.Semaphore(_SUMMARY_FETCH_LIMIT)
+
+# In-flight detail fetches by cache key, awaited by concurrent callers for the same Pokémon
+_detail_inflight: Dict[str, asyncio.Task] = {}
+# In-flight bulk fetches (write_cache=False), whose results the bulk caller writes in one pipeline
+_detail_batch_inflight: Dict[str, asyncio.Task] = {}
+# In-flight whole-list refreshes (summary, generations) by cache key, awaited by every caller that misses while one runs
+_refill_tasks: Dict[str, asyncio.Task] = {}
+
+async def _single_flight(registry: Dict[str, asyncio.Task], key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Awaits the task in flight for key in registry, starting it with factory() if there is none.
+
+    The task runs on its own: a caller that goes away (client disconnect) does not abort it
+    for the others, and a failure reaches every caller as the task's own exception.
+    """
+    task = registry.get(key)
+    if task is None:
+        task = registry[key] = asyncio.create_task(factory())
+        task.add_done_callback(lambda done: _clear_single_flight(registry, key, done))
+    else:
+        logger.info(f"Joining in-flight fetch for key '{key}'.")
+    return await asyncio.shield(task)
+
+def _clear_single_flight(registry: Dict[str, asyncio.Task], key: str, task: asyncio.Task):
+    """Forgets the finished task so the next miss starts a new one."""
+    if registry.get(key) is task:
+        del registry[key]
+    if not task.cancelled() and task.exception() is not None:
+        # Marks the exception retrieved even if every caller went away; callers still awaiting re-raise it
+        logger.debug(f"In-flight fetch for key '{key}' failed: {task.exception()!r}")
+
+def _jittered_memo_expiry(_key: Any, _value: Any, now: float) -> float:
+    """Expires memo entries within ±10% of memo_ttl_seconds, so entries cached together don't all lapse together."""
+    return now + settings.memo_ttl_seconds * random.uniform(0.9, 1.1)
+
+# In-process memos in front of Redis: built PokemonDetail objects by cache key,
+# and the small whole-list entries (summary JSON bytes, generations, types) by cache key
+_detail_memo: TLRUCache = TLRUCache(maxsize=settings.memo_detail_max_entries, ttu=_jittered_memo_expiry)
+_list_memo: TLRUCache = TLRUCache(maxsize=8, ttu=_jittered_memo_expiry)
+
+async def _fetch_pokemon_summary(pokemon_id: int, client: Optional[httpx.AsyncClient] = None, details: Optional[Dict[int, PokemonDetail]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Fetches and processes summary data for a single Pokémon from PokeAPI, including sprite.
+    Batch callers pass the shared client so it is looked up once per refresh, not per request.
+
+    The pokemon and species responses fetched here hold everything a PokemonDetail needs,
+    so callers that pass `details` also get the PokemonDetail, keyed by ID, to cache
+    in the same Redis write as the summary.
+
+    Returns a plain dict shaped like PokemonSummary; validation happens once for the
+    whole list in get_pokedex_summary_data.
+    """
+    async with _summary_fetch_semaphore:
+        # Default forms share their ID with the species, so both requests can go out together
+        pokemon_data, species_data = await asyncio.gather(
+            fetch_pokeapi(f"/pokemon/{pokemon_id}", client=client, report_not_found=True),
+            fetch_pokeapi(f"/pokemon-species/{pokemon_id}", client=client)
+        )
+    if pokemon_data is NOT_FOUND:
+        await _remember_not_found(str(pokemon_id))
+        return None
     if not pokemon_data:
         logger.warning(f"Could not fetch base data for Pokémon ID: {pokemon_id} from PokeAPI.")
         return None
-
-    species_info = pokemon_data.get('species', {})
-    species_url = species_info.get('url') if species_info else None
-
-    species_data = None
-    if species_url:
-         species_data = await fetch_pokeapi(species_url)
-    # Default species_data to empty dict if fetch failed or URL was missing
+    # The species URL linked from the Pokémon is the same /pokemon-species/{id} resource,
+    # so a failed species fetch is not retried; the flags and generation just fall back
     if species_data is None:
-         species_data = {}
+        logger.warning(f"Could not fetch species data for Pokémon ID: {pokemon_id} from PokeAPI.")
+        species_data = {}
 
     generation_name = species_data.get('generation', {}).get('name')
-    generation_id = _generation_name_to_id(generation_name) if generation_name else 0
+    generation_id = _GEN_ID_BY_NAME.get(generation_name, 0)
 
     types_list = pokemon_data.get('types', [])
-    types = [PokemonType(name=t.get('type', {}).get('name', 'unknown')) for t in types_list]
+    types = [{"name": t.get('type', {}).get('name', 'unknown')} for t in types_list]
 
     # --- Extract Sprite URL ---
     sprite_url = pokemon_data.get('sprites', {}).get('front_default')
-    # Ensure HTTPS
-    if sprite_url and sprite_url.startswith("http://"):
-         sprite_url = sprite_url.replace("http://", "https://", 1)
-         
+    # Ensure HTTPS (replace is a no-op on URLs that already use it)
+    if sprite_url:
+        sprite_url = sprite_url.replace("http://", "https://", 1)
+
     # --- Extract Status Flags ---
     is_legendary = species_data.get('is_legendary', False)
     is_mythical = species_data.get('is_mythical', False)
@@ -58,32 +183,185 @@ async def _fetch_pokemon_summary(pokemon_id: int) -> Optional[PokemonSummary]:
          logger.error(f"Missing critical ID or Name for Pokemon ID fetch attempt: {pokemon_id}. Skipping summary.")
          return None
 
-    return PokemonSummary(
-        id=poke_id,
-        name=poke_name,
-        generation_id=generation_id,
-        types=types,
-        sprite_url=sprite_url, # Add the sprite URL
-        is_legendary=is_legendary,
-        is_mythical=is_mythical,
-        is_baby=is_baby
-    )
+    if details is not None and species_data:
+        pokemon_detail = _build_pokemon_detail(pokemon_data, species_data, (pokemon_data.get('species') or {}).get('url'), str(poke_id))
+        if pokemon_detail is not None:
+            details[poke_id] = pokemon_detail
+
+    return {
+        "id": poke_id,
+        "name": poke_name,
+        "generation_id": generation_id,
+        "types": types,
+        "sprite_url": sprite_url, # Add the sprite URL
+        "is_legendary": is_legendary,
+        "is_mythical": is_mythical,
+        "is_baby": is_baby
+    }
     
+def _graphql_sprite_url(sprites: Any) -> Optional[str]:
+    """Extracts an absolute HTTPS front sprite URL from a GraphQL sprites blob."""
+    if isinstance(sprites, str): # Some API versions return the JSON column as a string
+        try:
+            sprites = json.loads(sprites)
+        except json.JSONDecodeError:
+            return None
+    sprite_url = sprites.get('front_default') if isinstance(sprites, dict) else None
+    if not sprite_url:
+        return None
+    if sprite_url.startswith("/media/"): # Older API versions use paths relative to the sprites repo
+        return f"{POKEAPI_SPRITE_BASE_URL}{sprite_url.removeprefix('/media/')}"
+    return sprite_url.replace("http://", "https://", 1)
+
+async def _fetch_summaries_graphql() -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetches summary dicts for all Pokémon up to the configured max ID with one GraphQL query.
+    Returns None if the query fails so the caller can fall back to REST.
+    """
+    data = await fetch_pokeapi_graphql(_GRAPHQL_SUMMARY_QUERY, variables={"max": settings.max_pokemon_id_to_fetch})
+    nodes = data.get('pokemon_v2_pokemon') if data else None
+    if not nodes:
+        logger.warning("PokeAPI GraphQL summary query returned no data.")
+        return None
+
+    summaries = []
+    for node in nodes:
+        species = node.get('pokemon_v2_pokemonspecy') or {}
+        generation_name = (species.get('pokemon_v2_generation') or {}).get('name')
+        sprite_rows = node.get('pokemon_v2_pokemonsprites') or []
+        summaries.append({
+            "id": node['id'],
+            "name": node['name'],
+            "generation_id": _GEN_ID_BY_NAME.get(generation_name, 0),
+            "types": [{"name": (t.get('pokemon_v2_type') or {}).get('name', 'unknown')} for t in node.get('pokemon_v2_pokemontypes', [])],
+            "sprite_url": _graphql_sprite_url(sprite_rows[0].get('sprites')) if sprite_rows else None,
+            "is_legendary": species.get('is_legendary', False),
+            "is_mythical": species.get('is_mythical', False),
+            "is_baby": species.get('is_baby', False)
+        })
+    # The query already orders by ID; sorting once here (linear on sorted input) keeps the
+    # cached shards in ID order even if that changes, so the serve path never sorts
+    summaries.sort(key=operator.itemgetter("id"))
+    return summaries
+
+async def _summary_worker(id_queue: asyncio.Queue, results: asyncio.Queue, client: httpx.AsyncClient, details: Optional[Dict[int, PokemonDetail]]):
+    """Fetches summaries for IDs taken from id_queue until it is empty, reporting (id, summary or None)."""
+    while not id_queue.empty():
+        pokemon_id = id_queue.get_nowait()
+        try:
+            summary = await _fetch_pokemon_summary(pokemon_id, client, details)
+        except Exception as e:
+            logger.error(f"Unexpected error fetching summary for Pokémon ID {pokemon_id}: {e}")
+            summary = None
+        results.put_nowait((pokemon_id, summary))
+
+async def _fetch_summary_blocks(pokemon_ids: List[int], block_size: int, details: Optional[Dict[int, PokemonDetail]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yields summaries in ID order, block by block, dropping failures.
+
+    A fixed pool of workers pulls IDs from a queue, so a slow Pokémon only holds up
+    its own worker rather than a whole batch. Results are re-ordered through a small
+    pending map, so memory stays proportional to the workers, not to the full list.
+    """
+    if not pokemon_ids:
+        return
+
+    id_queue: asyncio.Queue = asyncio.Queue()
+    for pokemon_id in pokemon_ids:
+        id_queue.put_nowait(pokemon_id)
+    results: asyncio.Queue = asyncio.Queue()
+    client = await get_client() # One lookup for the whole fan-out
+    workers = [
+        asyncio.create_task(_summary_worker(id_queue, results, client, details))
+        for _ in range(min(_SUMMARY_FETCH_LIMIT, len(pokemon_ids)))
+    ]
+
+    pending: Dict[int, Optional[Dict[str, Any]]] = {}
+    block: List[Dict[str, Any]] = []
+    next_index = 0
+    try:
+        for _ in range(len(pokemon_ids)):
+            pokemon_id, summary = await results.get()
+            pending[pokemon_id] = summary
+            # Release every summary that is now contiguous with those already handed out
+            while next_index < len(pokemon_ids) and pokemon_ids[next_index] in pending:
+                ready = pending.pop(pokemon_ids[next_index])
+                next_index += 1
+                if ready: # Only keep summaries that were successfully fetched
+                    block.append(ready)
+                if len(block) == block_size:
+                    yield block
+                    block = []
+        if block:
+            yield block
+    finally:
+        for worker in workers:
+            if not worker.done():
+                worker.cancel()
+
+async def _summary_pokemon_ids() -> List[int]:
+    """
+    Returns the Pokémon IDs up to the configured max ID, taken from the PokeAPI
+    /pokemon index so IDs without a Pokémon are never requested.
+    Falls back to the full ID range if the index cannot be fetched.
+    """
+    max_id = settings.max_pokemon_id_to_fetch
+    index_data = await fetch_pokeapi(f"/pokemon?limit={max_id}", revalidate=True)
+    if not index_data or not index_data.get('results'):
+        logger.warning("Could not fetch the PokeAPI Pokémon index, requesting every ID up to the max.")
+        return list(range(1, max_id + 1))
+
+    pokemon_ids = []
+    for entry in index_data['results']:
+        id_str = (entry.get('url') or '').rstrip('/').rsplit('/', 1)[-1]
+        if id_str.isdigit() and int(id_str) <= max_id:
+            pokemon_ids.append(int(id_str))
+    return sorted(pokemon_ids)
+
+async def _iter_summary_blocks(details: Optional[Dict[int, PokemonDetail]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yields summary dicts for all Pokémon in blocks of at most settings.summary_shard_size."""
+    block_size = max(1, settings.summary_shard_size)
+    all_summary_dicts = await _fetch_summaries_graphql() if settings.summary_use_graphql else None
+    if all_summary_dicts:
+        for start in range(0, len(all_summary_dicts), block_size):
+            yield all_summary_dicts[start:start + block_size]
+        return
+
+    # Per-Pokémon REST fan-out, used when GraphQL is disabled or unavailable
+    # (this path also fills `details` from the raw data it downloads anyway)
+    async for block in _fetch_summary_blocks(await _summary_pokemon_ids(), block_size, details):
+        yield block
+
+def _join_summary_shards(shards: List[bytes]) -> bytes:
+    """Concatenates JSON array shards into a single JSON array without re-parsing them."""
+    return b"[" + b",".join(shard[1:-1] for shard in shards if len(shard) > 2) + b"]"
+
+def _remember_generation_ids(generations: List[Generation]):
+    """Adds any generation not in _GEN_ID_BY_NAME yet, so summary/detail lookups stay plain dict gets."""
+    for generation in generations:
+        _GEN_ID_BY_NAME.setdefault(generation.name, generation.id)
+
+def _manifest_shard_set(manifest: Any) -> Tuple[Optional[str], int]:
+    """Returns the (refresh_id, shard count) a summary manifest points at, or (None, 0) if it is not usable."""
+    if isinstance(manifest, dict) and isinstance(manifest.get("refresh_id"), str) and manifest.get("shards"):
+        return manifest["refresh_id"], manifest["shards"]
+    return None, 0
+
 # --- Helper function to fetch single generation detail ---
-async def _fetch_generation_detail(gen_info: dict) -> Optional[Generation]:
+async def _fetch_generation_detail(gen_info: dict, client: Optional[httpx.AsyncClient] = None) -> Optional[Generation]:
     """Fetches details for a single generation to get its region."""
     gen_url = gen_info.get('url')
     if not gen_url:
         logger.warning(f"Missing URL for generation: {gen_info.get('name')}")
         return None
 
-    gen_detail_data = await fetch_pokeapi(gen_url)
+    gen_detail_data = await fetch_pokeapi(gen_url, client=client, revalidate=True)
     if not gen_detail_data:
         logger.warning(f"Failed to fetch details for generation URL: {gen_url}")
         return None
 
     gen_id_str = gen_detail_data.get('name') # e.g., generation-i
-    gen_id = _generation_name_to_id(gen_id_str)
+    gen_id = gen_detail_data.get('id') or _GEN_ID_BY_NAME.get(gen_id_str)
     region_info = gen_detail_data.get('main_region')
     region_name = region_info.get('name', 'unknown') if region_info else 'unknown' # Default if missing
 
@@ -97,49 +375,333 @@ async def _fetch_generation_detail(gen_info: dict) -> Optional[Generation]:
         region_name=region_name
     )
 
-async def get_pokedex_summary_data(force_refresh: bool = False) -> Optional[List[PokemonSummary]]:
+async def get_pokedex_summary_data(force_refresh: bool = False, raw: bool = False) -> Optional[Union[List[PokemonSummary], bytes]]:
     """
     Retrieves and caches the aggregated summary data for all Pokémon.
 
+    The summary is cached as the final JSON array bytes, so callers that only need
+    to send it over HTTP can skip pydantic entirely.
+
     Args:
         force_refresh: If True, bypasses cache and fetches fresh data from PokeAPI.
+        raw: If True, returns the JSON-encoded bytes instead of PokemonSummary objects.
 
     Returns:
-        A list of PokemonSummary objects, or None on failure.
+        A list of PokemonSummary objects (or JSON bytes if raw=True), or None on failure.
     """
     if not force_refresh:
-        cached_summary = await get_cache(POKEDEX_SUMMARY_CACHE_KEY)
+        cached_summary = _list_memo.get(POKEDEX_SUMMARY_CACHE_KEY)
+        if cached_summary is None:
+            manifest = await get_cache(POKEDEX_SUMMARY_MANIFEST_KEY)
+            refresh_id, shard_count = _manifest_shard_set(manifest)
+            shards = await get_cache_shards(POKEDEX_SUMMARY_CACHE_KEY, refresh_id, shard_count) if refresh_id else None
+            # Shards written in an older (non-JSON) format are treated as a miss
+            if shards and all(shard.startswith(b"[") for shard in shards):
+                cached_summary = _join_summary_shards(shards)
         if cached_summary:
             logger.info("Serving Pokedex summary data from cache.")
+            _list_memo[POKEDEX_SUMMARY_CACHE_KEY] = cached_summary
+            if raw:
+                return cached_summary
             try:
-                # Validate cached data against the PokedexSummary model
-                return [PokemonSummary(**item) for item in cached_summary] # Rehydrate as Pydantic objects
+                # Validate cached JSON against the PokemonSummary model
+                return _SUMMARY_LIST_ADAPTER.validate_json(cached_summary) # Rehydrate as Pydantic objects
             except Exception as e:
                 logger.error(f"Error validating cached Pokedex summary data, refreshing from PokeAPI. Error: {e}", exc_info=True)
-                # Fallback to fetching fresh data if cache validation fails
-                force_refresh = True # Proceed to refresh
+        force_refresh = True # Cache miss or invalid cache, proceed to refresh
 
     if force_refresh:
-        logger.info("Fetching fresh Pokedex summary data from PokeAPI...")
-        all_pokemon_summaries: List[PokemonSummary] = []
-        for pokemon_id in range(1, settings.max_pokemon_id_to_fetch + 1): # Iterate through Pokemon IDs
-            summary = await _fetch_pokemon_summary(pokemon_id)
-            if summary: # Only append if summary data was successfully fetched
-                all_pokemon_summaries.append(summary)
-
-        if all_pokemon_summaries:
-            # Store the *serialized* data in cache (list of dicts)
-            if await set_cache(POKEDEX_SUMMARY_CACHE_KEY, [s.model_dump() for s in all_pokemon_summaries]): # Serialize to JSON-compatible dicts
-                logger.info(f"Pokedex summary data cached successfully for key: {POKEDEX_SUMMARY_CACHE_KEY}")
-            else:
-                logger.warning(f"Failed to cache Pokedex summary data for key: {POKEDEX_SUMMARY_CACHE_KEY}")
-            return all_pokemon_summaries
-        else:
-            logger.error("Failed to aggregate Pokedex summary data from PokeAPI.")
-            return None # Indicate failure
+        summary_json = await _refill_pokedex_summary()
+        if summary_json is None:
+            return None
+        return summary_json if raw else _SUMMARY_LIST_ADAPTER.validate_json(summary_json)
 
     return None # Should not reach here under normal circumstances, but for type safety
 
+async def _refill_pokedex_summary() -> Optional[bytes]:
+    """
+    Runs a summary refresh, or joins the one already in progress.
+
+    Concurrent cache misses (e.g. several requests right after expiry) share a single
+    PokeAPI fan-out. The refresh runs as its own task, so a caller that goes away
+    (client disconnect) does not abort it for the others.
+    """
+    return await _single_flight(_refill_tasks, POKEDEX_SUMMARY_CACHE_KEY, _refresh_pokedex_summary)
+
+async def _refresh_pokedex_summary() -> Optional[bytes]:
+    """Fetches all summaries from PokeAPI, caches them as shards and returns the JSON bytes."""
+    logger.info("Fetching fresh Pokedex summary data from PokeAPI...")
+    # Load the generations once up front (memo/cache hit in the common case) so every
+    # summary resolves its generation ID from _GEN_ID_BY_NAME, new generations included
+    await get_all_generations_data()
+    # Shards go to a fresh key set; the cached list only switches to it when the manifest does
+    refresh_id = uuid.uuid4().hex
+    shards_cached = True
+    shards: List[bytes] = []
+    details: Dict[int, PokemonDetail] = {} # Filled by the REST path, drained block by block
+    async for summary_block in _iter_summary_blocks(details):
+        if not summary_block:
+            continue
+        try:
+            # One validation pass per block
+            block_summaries = _SUMMARY_LIST_ADAPTER.validate_python(summary_block)
+        except Exception as e:
+            logger.error(f"Failed to validate aggregated Pokedex summary data. Error: {e}", exc_info=True)
+            # The shards written so far are never published; let them expire like a superseded set
+            await expire_cache_shards(POKEDEX_SUMMARY_CACHE_KEY, refresh_id, len(shards), SUPERSEDED_SUMMARY_SHARDS_TTL_SECONDS)
+            return None
+
+        # Each block is serialized once and written as its own shard, together with
+        # a per-ID summary entry (and detail, when built) for each Pokémon, as soon as it arrives
+        shard_json = _SUMMARY_LIST_ADAPTER.dump_json(block_summaries)
+        per_id_values: Dict[str, Any] = {}
+        for summary in block_summaries:
+            per_id_values[f"{POKEMON_SUMMARY_CACHE_PREFIX}{summary.id}"] = summary
+            pokemon_detail = details.pop(summary.id, None)
+            if pokemon_detail is not None:
+                per_id_values[f"{POKEMON_DETAIL_CACHE_PREFIX}{summary.id}"] = pokemon_detail
+        if not await set_cache_shard(POKEDEX_SUMMARY_CACHE_KEY, refresh_id, len(shards), shard_json, values=per_id_values):
+            logger.warning(f"Failed to cache Pokedex summary shard {len(shards)} for key: {POKEDEX_SUMMARY_CACHE_KEY}")
+            shards_cached = False
+        shards.append(shard_json)
+
+    if not shards:
+        logger.error("Failed to aggregate Pokedex summary data from PokeAPI.")
+        return None # Indicate failure
+
+    summary_json = _join_summary_shards(shards)
+    _list_memo[POKEDEX_SUMMARY_CACHE_KEY] = summary_json
+    if not shards_cached:
+        # An incomplete set is never published; readers keep the previous complete one
+        logger.warning(f"Not publishing incomplete Pokedex summary shard set for key: {POKEDEX_SUMMARY_CACHE_KEY}")
+        await expire_cache_shards(POKEDEX_SUMMARY_CACHE_KEY, refresh_id, len(shards), SUPERSEDED_SUMMARY_SHARDS_TTL_SECONDS)
+        return summary_json
+
+    # Readers only see the new shards once the manifest points at them
+    previous_refresh_id, previous_shard_count = _manifest_shard_set(await get_cache(POKEDEX_SUMMARY_MANIFEST_KEY))
+    if await set_cache(POKEDEX_SUMMARY_MANIFEST_KEY, {"refresh_id": refresh_id, "shards": len(shards)}):
+        logger.info(f"Pokedex summary data cached successfully for key: {POKEDEX_SUMMARY_CACHE_KEY} ({len(shards)} shards)")
+        if previous_refresh_id and previous_refresh_id != refresh_id:
+            await expire_cache_shards(POKEDEX_SUMMARY_CACHE_KEY, previous_refresh_id, previous_shard_count, SUPERSEDED_SUMMARY_SHARDS_TTL_SECONDS)
+    else:
+        logger.warning(f"Failed to cache Pokedex summary manifest for key: {POKEDEX_SUMMARY_CACHE_KEY}")
+    return summary_json
+
+async def get_pokemon_summary_data(pokemon_id: int) -> Optional[PokemonSummary]:
+    """
+    Retrieves the summary of a single Pokémon without fetching its full details.
+
+    Served from the per-ID summary entry written alongside the summary shards; on a
+    miss only this Pokémon's summary is fetched from PokeAPI and cached. IDs PokeAPI
+    answers 404 for are negative-cached, like detail lookups.
+
+    Args:
+        pokemon_id: National Pokédex ID.
+
+    Returns:
+        A PokemonSummary object, or None if not found or error.
+    """
+    cache_key = f"{POKEMON_SUMMARY_CACHE_PREFIX}{pokemon_id}"
+    # The negative cache entry (shared with detail lookups) is read in the same round-trip
+    not_found_key = _not_found_key(str(pokemon_id))
+    cached_entries = await get_cache_many([cache_key, not_found_key])
+    cached_summary = cached_entries.get(cache_key)
+    if not cached_summary and not_found_key in cached_entries:
+        logger.info(f"Pokémon ID {pokemon_id} is cached as not found on PokeAPI.")
+        return None
+    if cached_summary:
+        try:
+            # Always validated, even with trust_cache_validation: PokemonSummary has no Python-level
+            # validators to skip, and pydantic-core validation is faster than model_construct here
+            return PokemonSummary.model_validate(cached_summary)
+        except Exception as e:
+            logger.error(f"Error validating cached Pokémon summary for ID {pokemon_id}, refreshing from PokeAPI. Error: {e}", exc_info=True)
+
+    details: Dict[int, PokemonDetail] = {}
+    summary_dict = await _fetch_pokemon_summary(pokemon_id, details=details)
+    if not summary_dict:
+        return None
+    try:
+        pokemon_summary = PokemonSummary.model_validate(summary_dict)
+    except Exception as e:
+        logger.error(f"Failed to create PokemonSummary object for ID {pokemon_id}. Error: {e}", exc_info=True)
+        return None
+    # The detail built from the same fetch goes out in the same pipeline
+    values = {cache_key: pokemon_summary}
+    values.update((f"{POKEMON_DETAIL_CACHE_PREFIX}{detail_id}", detail) for detail_id, detail in details.items())
+    if not await set_cache_many(values):
+        logger.warning(f"Failed to cache Pokémon summary for ID {pokemon_id}.")
+    return pokemon_summary
+
+def _detail_from_cache(cached_detail: dict) -> PokemonDetail:
+    """
+    Rebuilds a PokemonDetail from its cached dict.
+
+    With settings.trust_cache_validation, the sprites are rebuilt with model_construct,
+    skipping their per-field URL validators (already applied before caching). The rest
+    is still validated by pydantic-core, which is faster than model_construct for it.
+    """
+    if settings.trust_cache_validation:
+        try:
+            return PokemonDetail(**{**cached_detail, "sprites": PokemonSprites.model_construct(**cached_detail["sprites"])})
+        except (AttributeError, TypeError, KeyError) as e:
+            logger.warning(f"Trusted rehydration of cached detail failed, falling back to full validation. Error: {e}")
+    return PokemonDetail(**cached_detail)
+
+def _build_pokemon_detail(pokemon_data: Dict[str, Any], species_data: Dict[str, Any], species_url: Optional[str], api_identifier: str) -> Optional[PokemonDetail]:
+    """Builds a PokemonDetail from raw PokeAPI pokemon and species data, or None if that fails."""
+    # Missing keys read as None so every field comes out of a single itemgetter call
+    (habitat_info, shape_info, growth_rate_info, gender_rate_val, capture_rate_val,
+     base_happiness_val, hatch_counter_val, is_legendary_val, is_mythical_val, is_baby_val,
+     has_gender_differences_val, egg_groups_list, evolves_from_val, flavor_text_list,
+     genera_list, generation_info, evolution_chain_info) = _SPECIES_DETAIL_GETTER(defaultdict(_none, species_data))
+    (types_list, abilities_list, stats_list, height_val, weight_val,
+     base_exp_val, sprites_dict) = _POKEMON_DETAIL_GETTER(defaultdict(_none, pokemon_data))
+
+    generation_id = _GEN_ID_BY_NAME.get(generation_info.get('name')) if generation_info else None
+
+    # Only call .get('name') on nested values that are actually dicts (habitat etc. may be null)
+    habitat_name = habitat_info.get('name') if habitat_info else None
+    shape_name = shape_info.get('name') if shape_info else None
+    growth_rate_name_val = growth_rate_info.get('name') if growth_rate_info else None
+    evolution_chain_url_val = evolution_chain_info.get('url') if evolution_chain_info else None
+
+    try:
+        pokemon_detail = PokemonDetail(
+            # Required fields (should exist if pokemon_data is valid)
+            id=pokemon_data['id'], # Assume id exists if pokemon_data is valid
+            name=pokemon_data['name'], # Assume name exists
+
+            # Fields processed with defaults or safe gets
+            genus=genera_list or [], # Pass list to validator
+            generation_id=generation_id,
+            types=[_pokemon_type(t.get('type', {}).get('name', 'unknown')) for t in types_list or ()], # Safely access nested type name
+            abilities=[
+                PokemonAbility(
+                    name=a.get('ability', {}).get('name', 'unknown'),
+                    url=a.get('ability', {}).get('url', ''),
+                    is_hidden=a.get('is_hidden', False)
+                ) for a in abilities_list or ()
+            ], # Safely access nested ability info
+            height=height_val if height_val is not None else 0, # Default 0 if None
+            weight=weight_val if weight_val is not None else 0, # Default 0 if None
+            base_experience=base_exp_val if base_exp_val is not None else 0, # Default 0 if None
+            stats=[
+                PokemonStat(
+                    name=s.get('stat', {}).get('name', 'unknown'),
+                    base_stat=s.get('base_stat', 0) # Default 0 if missing
+                ) for s in stats_list or ()
+             ], # Safely access nested stat info
+            sprites=sprites_dict or {}, # Pass (potentially empty) dict to validator
+            species_url=species_url or "", # Default to empty string if None
+            evolution_chain_url=evolution_chain_url_val, # Pass None or the URL string (model field is Optional)
+            flavor_text_entries=flavor_text_list or [], # Pass potentially empty list
+            gender_rate=gender_rate_val if gender_rate_val is not None else -1, # Default -1 if None
+            capture_rate=capture_rate_val if capture_rate_val is not None else 0, # Default 0 if None
+            base_happiness=base_happiness_val if base_happiness_val is not None else 0, # Default 0 if None
+            hatch_counter=hatch_counter_val if hatch_counter_val is not None else 0, # Default 0 if None
+            egg_groups=egg_groups_list or [], # Pass potentially empty list
+            evolves_from_species=evolves_from_val, # Pass potentially empty list
+            habitat=habitat_name, # Pass None or the name (model field is Optional)
+            is_legendary=bool(is_legendary_val),
+            is_mythical=bool(is_mythical_val),
+            is_baby=bool(is_baby_val),
+            has_gender_differences=bool(has_gender_differences_val),
+            shape=shape_name, # Pass None or the name (model field is Optional)
+            growth_rate_name=growth_rate_name_val # Pass None or the name (model field is Optional)
+        )
+        return pokemon_detail
+
+    except Exception as e: # Catch Pydantic validation errors or others during creation
+        logger.error(f"Failed to create PokemonDetail object for '{api_identifier}' even after fetching data. Error: {e}", exc_info=True)
+        # Log the data that caused the failure? Be careful with PII/size.
+        # logger.debug(f"Pokemon Data: {pokemon_data}")
+        # logger.debug(f"Species Data: {species_data}")
+        return None # Return None if creation fails despite fetching
+
+def _not_found_key(pokemon_id_or_name: str) -> str:
+    """Builds the negative cache key for a Pokémon identifier (names are case-insensitive)."""
+    return f"{POKEMON_NOT_FOUND_CACHE_PREFIX}{str(pokemon_id_or_name).lower()}"
+
+async def _remember_not_found(pokemon_id_or_name: str):
+    """Records that PokeAPI has no such Pokémon, so lookups skip PokeAPI until the entry expires."""
+    logger.info(f"Caching not-found result for Pokémon '{pokemon_id_or_name}'.")
+    if not await set_cache(_not_found_key(pokemon_id_or_name), True, ttl=settings.not_found_cache_ttl_seconds):
+        logger.warning(f"Failed to cache not-found result for Pokémon '{pokemon_id_or_name}'.")
+
+async def _fetch_pokemon_detail(pokemon_id_or_name: str, cache_key: str, write_cache: bool = True) -> Optional[PokemonDetail]:
+    """
+    Fetches detail data for a Pokémon from PokeAPI, builds the model and caches it.
+    Batch callers pass write_cache=False and write all results in one pipeline.
+    """
+    logger.info(f"Fetching fresh Pokémon detail data for '{pokemon_id_or_name}' from PokeAPI...")
+    # Ensure identifier is lowercase string for API call if it's a name
+    api_identifier = str(pokemon_id_or_name).lower()
+    species_data = None
+    if api_identifier.isdigit() and int(api_identifier) <= settings.max_pokemon_id_to_fetch:
+        # Default-form IDs match their species ID, so fetch both concurrently
+        pokemon_data, species_data = await asyncio.gather(
+            fetch_pokeapi(f"/pokemon/{api_identifier}", report_not_found=True),
+            fetch_pokeapi(f"/pokemon-species/{api_identifier}")
+        )
+    else:
+        # Names are not guessed: form names (e.g. 'giratina-altered') have no species of the
+        # same name, and alternate form IDs (10001+) none with the same ID; use the species URL below
+        pokemon_data = await fetch_pokeapi(f"/pokemon/{api_identifier}", report_not_found=True)
+
+    if pokemon_data is NOT_FOUND:
+        await _remember_not_found(api_identifier)
+        return None
+
+    # CRITICAL CHECK: If pokemon_data itself is None, we cannot proceed.
+    if not pokemon_data:
+        logger.warning(f"Could not fetch Pokemon data for '{api_identifier}' from PokeAPI.")
+        return None # Cannot create detail without base data
+
+    # Use .get() with defaults for potentially missing keys in pokemon_data
+    species_info = pokemon_data.get('species', {}) # Default to empty dict if 'species' key is missing
+    species_url = species_info.get('url') if species_info else None # Get url only if species_info is not empty dict
+
+    if species_data is not None and species_info and species_data.get('name') != species_info.get('name'):
+        species_data = None # Guessed species belongs to a different Pokémon; refetch from the linked URL
+
+    if species_data is None and species_url: # Not fetched alongside the Pokémon data
+        species_data = await fetch_pokeapi(species_url)
+    elif not species_url:
+         logger.warning(f"Species URL not found or missing for Pokémon '{api_identifier}'. Some details might be unavailable.")
+
+    # Default species_data to empty dict if fetch failed or URL was missing
+    if species_data is None:
+        species_data = {} # Allows subsequent .get calls to work safely
+        logger.warning(f"Could not fetch species data for '{pokemon_id_or_name}' from PokeAPI at {species_url}.")
+
+    pokemon_detail = _build_pokemon_detail(pokemon_data, species_data, species_url, api_identifier)
+    if pokemon_detail is None or not write_cache:
+        return pokemon_detail
+    # Cache the successfully created object
+    if await set_cache(cache_key, pokemon_detail): # Serialized straight from the model
+        logger.info(f"Pokemon detail data for '{api_identifier}' cached successfully.")
+    else:
+        logger.warning(f"Failed to cache Pokemon detail data for '{api_identifier}'.")
+    return pokemon_detail
+
+async def _fetch_detail_single_flight(pokemon_id_or_name: str, cache_key: str, write_cache: bool = True) -> Optional[PokemonDetail]:
+    """
+    Fetches a detail from PokeAPI, sharing one fetch between concurrent misses for the same key.
+
+    A bulk fetch leaves the cache write to its caller, which may go away before writing, so
+    callers that need the write only join fetches that write it themselves.
+    """
+    registry = _detail_inflight if write_cache or cache_key in _detail_inflight else _detail_batch_inflight
+    return await _single_flight(registry, cache_key, lambda: _fetch_and_memo_detail(pokemon_id_or_name, cache_key, write_cache))
+
+async def _fetch_and_memo_detail(pokemon_id_or_name: str, cache_key: str, write_cache: bool) -> Optional[PokemonDetail]:
+    """Fetches a detail from PokeAPI and keeps the built model in the per-process memo."""
+    pokemon_detail = await _fetch_pokemon_detail(pokemon_id_or_name, cache_key, write_cache=write_cache)
+    if pokemon_detail is not None:
+        _detail_memo[cache_key] = pokemon_detail
+    return pokemon_detail
+
 async def get_pokemon_detail_data(pokemon_id_or_name: str, force_refresh: bool = False) -> Optional[PokemonDetail]:
     """
     Retrieves and caches detailed data for a specific Pokémon.
@@ -154,11 +716,23 @@ async def get_pokemon_detail_data(pokemon_id_or_name: str, force_refresh: bool =
     cache_key = f"{POKEMON_DETAIL_CACHE_PREFIX}{pokemon_id_or_name}"
 
     if not force_refresh:
-        cached_detail = await get_cache(cache_key)
+        memo_hit = _detail_memo.get(cache_key)
+        if memo_hit is not None:
+            return memo_hit # Already built in this process, no Redis round-trip
+
+        # The negative cache entry is read in the same round-trip as the detail
+        not_found_key = _not_found_key(pokemon_id_or_name)
+        cached_entries = await get_cache_many([cache_key, not_found_key])
+        cached_detail = cached_entries.get(cache_key)
+        if not cached_detail and not_found_key in cached_entries:
+            logger.info(f"Pokémon '{pokemon_id_or_name}' is cached as not found on PokeAPI.")
+            return None
         if cached_detail:
             logger.info(f"Serving Pokémon detail data for '{pokemon_id_or_name}' from cache.")
             try:
-                return PokemonDetail(**cached_detail) # Rehydrate from cached dict
+                pokemon_detail = _detail_from_cache(cached_detail) # Rehydrate from cached dict
+                _detail_memo[cache_key] = pokemon_detail
+                return pokemon_detail
             except Exception as e:
                 logger.error(f"Error validating cached Pokemon detail data for '{pokemon_id_or_name}', refreshing from PokeAPI. Error: {e}", exc_info=True)
                 # Clear potentially bad cache entry before refreshing
@@ -166,202 +740,167 @@ async def get_pokemon_detail_data(pokemon_id_or_name: str, force_refresh: bool =
         force_refresh = True # Fallback to refresh
 
     if force_refresh:
-        logger.info(f"Fetching fresh Pokémon detail data for '{pokemon_id_or_name}' from PokeAPI...")
-        # Ensure identifier is lowercase string for API call if it's a name
-        api_identifier = str(pokemon_id_or_name).lower()
-        pokemon_data = await fetch_pokeapi(f"/pokemon/{api_identifier}")
-        
-        # CRITICAL CHECK: If pokemon_data itself is None, we cannot proceed.
-        if not pokemon_data:
-            logger.warning(f"Could not fetch Pokemon data for '{api_identifier}' from PokeAPI.")
-            return None # Cannot create detail without base data
-
-        # Use .get() with defaults for potentially missing keys in pokemon_data
-        species_info = pokemon_data.get('species', {}) # Default to empty dict if 'species' key is missing
-        species_url = species_info.get('url') if species_info else None # Get url only if species_info is not empty dict
-        
-        species_data = None
-        if species_url:
-            species_data = await fetch_pokeapi(species_url)
-        else:
-             logger.warning(f"Species URL not found or missing for Pokémon '{api_identifier}'. Some details might be unavailable.")
-
-        # Default species_data to empty dict if fetch failed or URL was missing
-        if species_data is None:
-            species_data = {} # Allows subsequent .get calls to work safely
-            logger.warning(f"Could not fetch species data for '{pokemon_id_or_name}' from PokeAPI at {species_url}.")
-
-        generation_name = species_data.get('generation', {}).get('name')
-        generation_id = _generation_name_to_id(generation_name) if generation_name else None
-
-        # Ensure lists default to empty lists if key is missing
-        types_list = pokemon_data.get('types', [])
-        abilities_list = pokemon_data.get('abilities', []) # List of ability dicts
-        stats_list = pokemon_data.get('stats', [])
-        egg_groups_list = species_data.get('egg_groups', [])
-        evolves_from_val = species_data.get('evolves_from_species')
-        flavor_text_list = species_data.get('flavor_text_entries', [])
-        genera_list = species_data.get('genera', []) # For genus extraction validator
-
-        # Handle potentially None numerical values with default 0 (or adjust default as needed)
-        height_val = pokemon_data.get('height')
-        weight_val = pokemon_data.get('weight')
-        base_exp_val = pokemon_data.get('base_experience')
-        gender_rate_val = species_data.get('gender_rate') # Can be -1 for genderless
-        capture_rate_val = species_data.get('capture_rate') # API uses capture_rate
-        base_happiness_val = species_data.get('base_happiness')
-        hatch_counter_val = species_data.get('hatch_counter')
-        
-        # Handle potentially missing OR null nested dictionaries before getting 'name'
-        habitat_info = species_data.get('habitat') # Get the habitat value (could be dict or None)
-        habitat_name = habitat_info.get('name') if habitat_info else None # Only call .get('name') if habitat_info is a dict
-        
-        shape_info = species_data.get('shape') # Get the shape value
-        shape_name = shape_info.get('name') if shape_info else None # Only call .get('name') if shape_info is a dict
-
-        growth_rate_info = species_data.get('growth_rate') # Get the growth_rate value
-        growth_rate_name_val = growth_rate_info.get('name') if growth_rate_info else None # Only call .get('name') if growth_rate_info is a dict
-
-        # Handle boolean values with default False
-        is_legendary_val = species_data.get('is_legendary', False)
-        is_mythical_val = species_data.get('is_mythical', False)
-        is_baby_val = species_data.get('is_baby', False)
-        has_gender_differences_val = species_data.get('has_gender_differences', False)
-
-        # Get sprites dict, defaulting to empty dict if missing
-        sprites_dict = pokemon_data.get('sprites', {})
+        return await _fetch_detail_single_flight(pokemon_id_or_name, cache_key)
 
-        try:
-            pokemon_detail = PokemonDetail(
-                # Required fields (should exist if pokemon_data is valid)
-                id=pokemon_data['id'], # Assume id exists if pokemon_data is valid
-                name=pokemon_data['name'], # Assume name exists
-
-                # Fields processed with defaults or safe gets
-                genus=genera_list, # Pass list to validator
-                generation_id=generation_id,
-                types=[PokemonType(name=t.get('type', {}).get('name', 'unknown')) for t in types_list], # Safely access nested type name
-                abilities=[
-                    PokemonAbility(
-                        name=a.get('ability', {}).get('name', 'unknown'),
-                        url=a.get('ability', {}).get('url', ''),
-                        is_hidden=a.get('is_hidden', False)
-                    ) for a in abilities_list
-                ], # Safely access nested ability info
-                height=height_val if height_val is not None else 0, # Default 0 if None
-                weight=weight_val if weight_val is not None else 0, # Default 0 if None
-                base_experience=base_exp_val if base_exp_val is not None else 0, # Default 0 if None
-                stats=[
-                    PokemonStat(
-                        name=s.get('stat', {}).get('name', 'unknown'),
-                        base_stat=s.get('base_stat', 0) # Default 0 if missing
-                    ) for s in stats_list
-                 ], # Safely access nested stat info
-                sprites=sprites_dict, # Pass (potentially empty) dict to validator
-                species_url=species_url or "", # Default to empty string if None
-                evolution_chain_url=species_data, # Pass dict to validator (validator handles missing 'evolution_chain')
-                flavor_text_entries=flavor_text_list, # Pass potentially empty list
-                gender_rate=gender_rate_val if gender_rate_val is not None else -1, # Default -1 if None
-                capture_rate=capture_rate_val if capture_rate_val is not None else 0, # Default 0 if None
-                base_happiness=base_happiness_val if base_happiness_val is not None else 0, # Default 0 if None
-                hatch_counter=hatch_counter_val if hatch_counter_val is not None else 0, # Default 0 if None
-                egg_groups=egg_groups_list, # Pass potentially empty list
-                evolves_from_species=evolves_from_val, # Pass potentially empty list
-                habitat=habitat_name, # Pass None or the name (model field is Optional)
-                is_legendary=is_legendary_val,
-                is_mythical=is_mythical_val,
-                is_baby=is_baby_val,
-                has_gender_differences=has_gender_differences_val,
-                shape=shape_name, # Pass None or the name (model field is Optional)
-                growth_rate_name=growth_rate_name_val # Pass None or the name (model field is Optional)
-            )
-
-            # Cache the successfully created object
-            if await set_cache(cache_key, pokemon_detail.model_dump()):
-                logger.info(f"Pokemon detail data for '{api_identifier}' cached successfully.")
-            else:
-                logger.warning(f"Failed to cache Pokemon detail data for '{api_identifier}'.")
-            return pokemon_detail
-
-        except Exception as e: # Catch Pydantic validation errors or others during creation
-            logger.error(f"Failed to create PokemonDetail object for '{api_identifier}' even after fetching data. Error: {e}", exc_info=True)
-            # Log the data that caused the failure? Be careful with PII/size.
-            # logger.debug(f"Pokemon Data: {pokemon_data}")
-            # logger.debug(f"Species Data: {species_data}")
-            return None # Return None if creation fails despite fetching
-        
     # This path should ideally not be reached if logic is correct
     logger.error(f"Reached end of get_pokemon_detail_data for '{pokemon_id_or_name}' without returning data.")
     return None # Should not reach here, but for type safety
 
+async def get_pokemon_details_bulk(pokemon_ids_or_names: List[str]) -> List[PokemonDetail]:
+    """
+    Retrieves detailed data for several Pokémon with one Redis read and one Redis write.
+
+    Cached entries come from a single MGET; only the misses are fetched from PokeAPI
+    (concurrently), and their results are written back in one pipeline.
+
+    Args:
+        pokemon_ids_or_names: Pokémon IDs or names (lowercase).
+
+    Returns:
+        PokemonDetail objects in request order; identifiers that could not be found are skipped.
+    """
+    cache_keys = [f"{POKEMON_DETAIL_CACHE_PREFIX}{identifier}" for identifier in pokemon_ids_or_names]
+    details: Dict[str, PokemonDetail] = {}
+    for cache_key in cache_keys:
+        memo_hit = _detail_memo.get(cache_key)
+        if memo_hit is not None:
+            details[cache_key] = memo_hit
+
+    # Detail keys not in the memo, mapped to their negative cache keys; both are read in one MGET
+    not_found_keys = {key: _not_found_key(identifier) for key, identifier in zip(cache_keys, pokemon_ids_or_names) if key not in details}
+    cached_details = await get_cache_many([*not_found_keys, *not_found_keys.values()])
+    for cache_key in not_found_keys:
+        cached_detail = cached_details.get(cache_key)
+        if not cached_detail:
+            continue
+        try:
+            details[cache_key] = _detail_memo[cache_key] = _detail_from_cache(cached_detail)
+        except Exception as e:
+            logger.error(f"Error validating cached Pokemon detail data for key '{cache_key}', refreshing from PokeAPI. Error: {e}", exc_info=True)
+
+    missing = {
+        key: identifier for key, identifier in zip(cache_keys, pokemon_ids_or_names)
+        if key not in details and not_found_keys[key] not in cached_details # Skip known-missing Pokémon
+    }
+    if missing:
+        logger.info(f"Fetching {len(missing)} of {len(cache_keys)} Pokémon details from PokeAPI.")
+        results = await asyncio.gather(
+            *(_fetch_detail_single_flight(identifier, key, write_cache=False) for key, identifier in missing.items()),
+            return_exceptions=True
+        )
+        fetched = {}
+        for (cache_key, identifier), result in zip(missing.items(), results):
+            if isinstance(result, PokemonDetail):
+                fetched[cache_key] = details[cache_key] = result
+            elif isinstance(result, BaseException): # Includes CancelledError, which is not an Exception
+                logger.error(f"Unexpected error fetching Pokémon detail data for '{identifier}': {result!r}")
+        if fetched and not await set_cache_many(fetched):
+            logger.warning(f"Failed to cache {len(fetched)} fetched Pokémon details.")
+
+    return [details[key] for key in cache_keys if key in details]
+
 async def get_all_generations_data(force_refresh: bool = False) -> Optional[List[Generation]]:
     """Fetches and caches data for all Pokemon generations."""
     if not force_refresh:
+        memo_hit = _list_memo.get(GENERATIONS_CACHE_KEY)
+        if memo_hit is not None:
+            return memo_hit # Already built in this process, no Redis round-trip
+
         cached_generations = await get_cache(GENERATIONS_CACHE_KEY)
         if cached_generations:
             logger.info("Serving Pokemon generations data from cache.")
             try:
                 # Validate against the updated Generation model
-                return [Generation(**item) for item in cached_generations]
+                generations = _list_memo[GENERATIONS_CACHE_KEY] = _GENERATION_LIST_ADAPTER.validate_python(cached_generations)
+                _remember_generation_ids(generations)
+                return generations
             except Exception as e:
                 logger.error(f"Error validating cached generations data, refreshing from PokeAPI. Error: {e}", exc_info=True)
                 await clear_cache(GENERATIONS_CACHE_KEY) # Clear bad cache
-                force_refresh = True
+        force_refresh = True # Cache miss or invalid cache, proceed to refresh
 
     if force_refresh:
-        logger.info("Fetching fresh Pokemon generations data from PokeAPI...")
-        generations_list_data = await fetch_pokeapi("/generation?limit=100") # Limit large enough to get all generations
-
-        if generations_list_data and generations_list_data.get('results'):
-            generation_infos = generations_list_data['results']
-            logger.info(f"Found {len(generation_infos)} generations. Fetching details...")
-
-            # --- Fetch details concurrently ---
-            tasks = [_fetch_generation_detail(gen_info) for gen_info in generation_infos]
-            results = await asyncio.gather(*tasks)
-            # --------------------------------
-
-            # Filter out None results (failures) and sort by ID
-            valid_generations = sorted(
-                [gen for gen in results if gen is not None],
-                key=lambda g: g.id
-            )
-
-            if valid_generations:
-                # Cache using model_dump() to store plain dicts
-                if await set_cache(GENERATIONS_CACHE_KEY, [g.model_dump() for g in valid_generations]):
-                    logger.info("Pokemon generations data (with regions) cached successfully.")
-                else:
-                    logger.warning("Failed to cache Pokemon generations data.")
-                return valid_generations
+        return await _refill_generations()
+    # Should not be reached under normal flow
+    return None
+
+async def _refill_generations() -> Optional[List[Generation]]:
+    """
+    Runs a generations refresh, or joins the one already in progress.
+
+    The startup warmup and the summary refresh both need the generations; sharing the
+    in-flight refresh (like _refill_pokedex_summary) means a cold start fetches them once.
+    """
+    return await _single_flight(_refill_tasks, GENERATIONS_CACHE_KEY, _refresh_generations)
+
+async def _refresh_generations() -> Optional[List[Generation]]:
+    """Fetches all generations (with their regions) from PokeAPI and caches them."""
+    logger.info("Fetching fresh Pokemon generations data from PokeAPI...")
+    generations_list_data = await fetch_pokeapi("/generation?limit=100", revalidate=True) # Limit large enough to get all generations
+
+    if generations_list_data and generations_list_data.get('results'):
+        generation_infos = generations_list_data['results']
+        logger.info(f"Found {len(generation_infos)} generations. Fetching details...")
+
+        # --- Fetch details concurrently ---
+        client = await get_client() # Shared by all generation detail fetches
+        tasks = [_fetch_generation_detail(gen_info, client) for gen_info in generation_infos]
+        # return_exceptions: one failing generation must not cancel the others
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # --------------------------------
+
+        for gen_info, result in zip(generation_infos, results):
+            if isinstance(result, Exception):
+                logger.error(f"Unexpected error fetching generation '{gen_info.get('name')}': {result}")
+
+        # Filter out None results and exceptions (failures) and sort by ID
+        valid_generations = sorted(
+            [gen for gen in results if isinstance(gen, Generation)],
+            key=lambda g: g.id
+        )
+
+        if valid_generations:
+            _list_memo[GENERATIONS_CACHE_KEY] = valid_generations
+            _remember_generation_ids(valid_generations)
+            # Models are packed directly, without an intermediate list of dicts
+            if await set_cache(GENERATIONS_CACHE_KEY, valid_generations):
+                logger.info("Pokemon generations data (with regions) cached successfully.")
             else:
-                logger.error("Failed to fetch details for any generation.")
-                return None
+                logger.warning("Failed to cache Pokemon generations data.")
+            return valid_generations
         else:
-            logger.error("Failed to fetch initial Pokemon generations list from PokeAPI.")
+            logger.error("Failed to fetch details for any generation.")
             return None
-    # Should not be reached under normal flow
-    return None
+    else:
+        logger.error("Failed to fetch initial Pokemon generations list from PokeAPI.")
+        return None
 
 async def get_all_types_data(force_refresh: bool = False) -> Optional[List[PokemonTypeFilter]]:
     """Fetches and caches data for all Pokemon types."""
     if not force_refresh:
+        memo_hit = _list_memo.get(TYPES_CACHE_KEY)
+        if memo_hit is not None:
+            return memo_hit # Already built in this process, no Redis round-trip
+
         cached_types = await get_cache(TYPES_CACHE_KEY)
         if cached_types:
             logger.info("Serving Pokemon types data from cache.")
             try:
-                return [PokemonTypeFilter(**item) for item in cached_types]
+                types = _list_memo[TYPES_CACHE_KEY] = _TYPE_LIST_ADAPTER.validate_python(cached_types)
+                return types
             except Exception as e:
                 logger.error(f"Error validating cached types data, refreshing from PokeAPI. Error: {e}", exc_info=True)
-                force_refresh = True
+        force_refresh = True # Cache miss or invalid cache, proceed to refresh
 
     if force_refresh:
         logger.info("Fetching fresh Pokemon types data from PokeAPI...")
-        types_data = await fetch_pokeapi("/type?limit=100") # Limit large enough for all types
+        types_data = await fetch_pokeapi("/type?limit=100", revalidate=True) # Limit large enough for all types
         if types_data and types_data.get('results'):
-            types = [PokemonTypeFilter(name=type_data['name']) for type_data in types_data['results']]
+            # One validation call for the whole list; the 'url' of each entry is ignored
+            types = _TYPE_LIST_ADAPTER.validate_python(types_data['results'])
             if types:
-                if await set_cache(TYPES_CACHE_KEY, [t.model_dump() for t in types]):
+                _list_memo[TYPES_CACHE_KEY] = types
+                if await set_cache(TYPES_CACHE_KEY, types):
                     logger.info("Pokemon types data cached successfully.")
                 else:
                     logger.warning("Failed to cache Pokemon types data.")
@@ -371,54 +910,6 @@ async def get_all_types_data(force_refresh: bool = False) -> Optional[List[Pokem
             return None
     return None
 
-@lru_cache(maxsize=16) # Cache results for generation names
-def _generation_name_to_id(generation_name: Optional[str]) -> Optional[int]:
-    """
-    Helper function to convert generation name (e.g., 'generation-i', 'generation-ix')
-    to its corresponding integer ID (e.g., 1, 9).
-    Handles Roman numerals I through IX.
-    """
-    if not generation_name:
-        logger.warning("Received empty generation name.")
-        return None
-
-    # Mapping for Roman numerals used in PokeAPI generation names
-    roman_to_int_map = {
-        "i": 1,
-        "ii": 2,
-        "iii": 3,
-        "iv": 4,
-        "v": 5,
-        "vi": 6,
-        "vii": 7,
-        "viii": 8,
-        "ix": 9,
-        # Add more mappings here if new generations use Roman numerals
-    }
-
-    try:
-        # Split the string, e.g., "generation-ix" -> ["generation", "ix"]
-        parts = generation_name.lower().split('-')
-        if len(parts) != 2 or not parts[1]:
-            logger.warning(f"Could not parse Roman numeral from generation name: {generation_name}")
-            return None
-
-        roman_numeral = parts[1]
-
-        # Look up the Roman numeral in our map
-        generation_id = roman_to_int_map.get(roman_numeral)
-
-        if generation_id is None:
-            logger.warning(f"Unknown or unsupported Roman numeral '{roman_numeral}' in generation name: {generation_name}")
-            return None # Return None if the Roman numeral is not in our map
-
-        return generation_id
-
-    except Exception as e: # Catch potential errors during split or processing
-        logger.error(f"Error converting generation name '{generation_name}' to ID: {e}", exc_info=True)
-        return None
-
-
 # Example Usage (for testing within this module)
 async def main():
     # Fetch and print Pokedex summary data
@@ -467,4 +958,10 @@ if __name__ == "__main__":
     async def main_with_timing():
         await measure_time(main) # Run main function and measure its total time
 
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy()) # Same loop as the server
+    except ImportError:
+        pass
+
     asyncio.run(main_with_timing())
\ No newline at end of file
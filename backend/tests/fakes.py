@@ -0,0 +1,27 @@
+# backend/tests/fakes.py
+
+import fakeredis # Test-only dependency, see requirements-dev.txt
+
+from app import cache
+from app import pokedex_data
+
+def use_fake_redis() -> fakeredis.FakeAsyncRedis:
+    """Points the cache module at a fresh in-memory Redis and clears the in-process memos."""
+    fake_redis = fakeredis.FakeAsyncRedis(decode_responses=False)
+    cache.redis_pool = fake_redis.connection_pool
+    clear_memos()
+    return fake_redis
+
+def clear_memos():
+    """Empties the in-process memos, so the next read goes through Redis."""
+    pokedex_data._list_memo.clear()
+    pokedex_data._detail_memo.clear()
+
+def summary_dict(pokemon_id: int, name_suffix: str = "") -> dict:
+    """A minimal summary dict, as yielded by _iter_summary_blocks."""
+    return {
+        "id": pokemon_id,
+        "name": f"pokemon-{pokemon_id}{name_suffix}",
+        "generation_id": 1,
+        "types": [{"name": "normal"}],
+    }
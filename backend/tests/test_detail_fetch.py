@@ -0,0 +1,48 @@
+# backend/tests/test_detail_fetch.py
+
+import unittest
+from unittest import mock
+
+from tests.fakes import use_fake_redis
+from app import pokedex_data
+
+SPECIES_URL = "https://pokeapi.co/api/v2/pokemon-species/487/"
+
+POKEMON = {
+    "id": 487, "name": "giratina-altered", "height": 45, "weight": 7500, "base_experience": 340,
+    "types": [{"slot": 1, "type": {"name": "ghost"}}], "abilities": [], "stats": [], "sprites": {},
+    "species": {"name": "giratina", "url": SPECIES_URL},
+}
+SPECIES = {
+    "id": 487, "name": "giratina", "generation": {"name": "generation-iv"},
+    "genera": [{"genus": "Renegade Pokémon", "language": {"name": "en"}}],
+    "flavor_text_entries": [], "egg_groups": [], "gender_rate": -1, "capture_rate": 3,
+}
+
+class DetailFetchTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        use_fake_redis()
+        self.requested = []
+
+    async def _fetch_pokeapi(self, endpoint, client=None, revalidate=False, report_not_found=False):
+        self.requested.append(endpoint)
+        return {"/pokemon/487": POKEMON, "/pokemon/giratina-altered": POKEMON, "/pokemon-species/487": SPECIES, SPECIES_URL: SPECIES}.get(endpoint)
+
+    async def _fetch_detail(self, identifier):
+        with mock.patch.object(pokedex_data, "fetch_pokeapi", self._fetch_pokeapi):
+            return await pokedex_data._fetch_pokemon_detail(identifier, f"{pokedex_data.POKEMON_DETAIL_CACHE_PREFIX}{identifier}")
+
+    async def test_form_name_does_not_guess_species(self):
+        detail = await self._fetch_detail("giratina-altered")
+
+        self.assertEqual(detail.genus, "Renegade Pokémon")
+        self.assertEqual(self.requested, ["/pokemon/giratina-altered", SPECIES_URL])
+
+    async def test_id_fetches_species_concurrently(self):
+        detail = await self._fetch_detail("487")
+
+        self.assertEqual(detail.generation_id, 4)
+        self.assertEqual(sorted(self.requested), ["/pokemon-species/487", "/pokemon/487"])
+
+if __name__ == "__main__":
+    unittest.main()
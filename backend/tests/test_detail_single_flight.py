@@ -0,0 +1,96 @@
+# backend/tests/test_detail_single_flight.py
+
+import asyncio
+import unittest
+from unittest import mock
+
+from tests.fakes import use_fake_redis
+from app import pokedex_data
+
+CACHE_KEY = f"{pokedex_data.POKEMON_DETAIL_CACHE_PREFIX}25"
+
+class DetailSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        use_fake_redis()
+        self.release = asyncio.Event()
+        self.fetch_calls = 0
+        self.fetch_writes = []
+
+    def _patch_fetch(self, outcome):
+        """Replaces the PokeAPI detail fetch with one that waits for self.release, then returns or raises `outcome`."""
+        async def fetch(pokemon_id_or_name, cache_key, write_cache=True):
+            self.fetch_calls += 1
+            self.fetch_writes.append(write_cache)
+            await self.release.wait()
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+        patcher = mock.patch.object(pokedex_data, "_fetch_pokemon_detail", fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _start_callers(self, count, write_cache=True):
+        return [asyncio.create_task(pokedex_data._fetch_detail_single_flight("25", CACHE_KEY, write_cache)) for _ in range(count)]
+
+    async def test_waiters_get_owner_error(self):
+        self._patch_fetch(RuntimeError("PokeAPI exploded"))
+        owner, waiter = self._start_callers(2)
+        await asyncio.sleep(0)
+        self.release.set()
+
+        for caller in (owner, waiter):
+            with self.assertRaisesRegex(RuntimeError, "PokeAPI exploded"):
+                await caller
+        self.assertEqual(self.fetch_calls, 1)
+        self.assertNotIn(CACHE_KEY, pokedex_data._detail_inflight)
+
+    async def test_waiters_get_none_when_owner_finds_nothing(self):
+        self._patch_fetch(None)
+        owner, waiter = self._start_callers(2)
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertIsNone(await owner)
+        self.assertIsNone(await waiter)
+        self.assertEqual(self.fetch_calls, 1)
+
+    async def test_cancelled_owner_does_not_cancel_waiters(self):
+        detail = mock.sentinel.detail
+        self._patch_fetch(detail)
+        owner, waiter = self._start_callers(2)
+        await asyncio.sleep(0)
+
+        owner.cancel() # e.g. the owner's client disconnected
+        with self.assertRaises(asyncio.CancelledError):
+            await owner
+        self.release.set()
+
+        self.assertIs(await waiter, detail)
+        self.assertEqual(self.fetch_calls, 1)
+        self.assertIs(pokedex_data._detail_memo[CACHE_KEY], detail)
+
+    async def test_writer_does_not_join_bulk_fetch(self):
+        self._patch_fetch(mock.sentinel.detail)
+        bulk, = self._start_callers(1, write_cache=False)
+        await asyncio.sleep(0)
+        writer, = self._start_callers(1)
+        await asyncio.sleep(0)
+        self.release.set()
+
+        await asyncio.gather(bulk, writer)
+        self.assertEqual(self.fetch_writes, [False, True]) # The writer's own fetch writes the cache
+
+    async def test_bulk_fetch_joins_writing_fetch(self):
+        self._patch_fetch(mock.sentinel.detail)
+        writer, = self._start_callers(1)
+        await asyncio.sleep(0)
+        bulk, = self._start_callers(1, write_cache=False)
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertIs(await bulk, mock.sentinel.detail)
+        await writer
+        self.assertEqual(self.fetch_writes, [True])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+# backend/tests/test_details_bulk.py
+
+import asyncio
+import unittest
+from unittest import mock
+
+from tests.fakes import use_fake_redis
+from app import pokedex_data
+from app.models import PokemonDetail
+
+class DetailsBulkTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        use_fake_redis()
+
+    async def test_cancelled_fetch_is_skipped(self):
+        detail = PokemonDetail.model_construct(id=1, name="bulbasaur")
+
+        async def fetch(pokemon_id_or_name, cache_key, write_cache=True):
+            if pokemon_id_or_name == "2":
+                raise asyncio.CancelledError()
+            return detail
+
+        set_cache_many = mock.AsyncMock(return_value=True)
+        with mock.patch.object(pokedex_data, "_fetch_detail_single_flight", fetch), \
+             mock.patch.object(pokedex_data, "set_cache_many", set_cache_many):
+            details = await pokedex_data.get_pokemon_details_bulk(["1", "2"])
+
+        self.assertEqual(details, [detail])
+        set_cache_many.assert_awaited_once_with({f"{pokedex_data.POKEMON_DETAIL_CACHE_PREFIX}1": detail})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+# backend/tests/test_generations.py
+
+import asyncio
+import unittest
+from unittest import mock
+
+from tests.fakes import use_fake_redis, summary_dict
+from app import pokedex_data
+from app.models import Generation
+
+GENERATIONS = [Generation(id=1, name="generation-i", region_name="kanto")]
+
+class GenerationsRefillTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        use_fake_redis()
+        self.refresh_calls = 0
+
+    async def _refresh_generations(self):
+        self.refresh_calls += 1
+        await asyncio.sleep(0.01)
+        return GENERATIONS
+
+    async def test_cold_start_fetches_generations_once(self):
+        async def iter_blocks(details=None):
+            yield [summary_dict(1)]
+
+        with mock.patch.object(pokedex_data, "_refresh_generations", self._refresh_generations), \
+             mock.patch.object(pokedex_data, "_iter_summary_blocks", iter_blocks):
+            # What the startup warmup does: the summary refresh and the generations miss run together
+            summary, generations = await asyncio.gather(
+                pokedex_data.get_pokedex_summary_data(raw=True),
+                pokedex_data.get_all_generations_data(),
+            )
+
+        self.assertIsNotNone(summary)
+        self.assertEqual(generations, GENERATIONS)
+        self.assertEqual(self.refresh_calls, 1)
+        self.assertNotIn(pokedex_data.GENERATIONS_CACHE_KEY, pokedex_data._refill_tasks)
+
+if __name__ == "__main__":
+    unittest.main()
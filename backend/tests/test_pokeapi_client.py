@@ -0,0 +1,34 @@
+# backend/tests/test_pokeapi_client.py
+
+import unittest
+
+import httpx
+
+from app import pokeapi_client
+
+URL = f"{pokeapi_client.BASE_URL}/type?limit=100"
+
+class RevalidateTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        pokeapi_client._etag_cache.clear()
+        self.addCleanup(pokeapi_client._etag_cache.clear)
+
+        def respond(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"results": [{"name": "grass"}]}, headers={"ETag": '"v1"'})
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        self.addAsyncCleanup(self.client.aclose)
+
+    async def test_not_modified_body_is_not_shared(self):
+        first = await pokeapi_client.fetch_pokeapi(URL, client=self.client, revalidate=True)
+        first["results"].clear() # A caller mutating its result
+
+        second = await pokeapi_client.fetch_pokeapi(URL, client=self.client, revalidate=True)
+        second["results"].append({"name": "fire"})
+        third = await pokeapi_client.fetch_pokeapi(URL, client=self.client, revalidate=True)
+
+        self.assertEqual(third, {"results": [{"name": "grass"}]})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+# backend/tests/test_summary_not_found.py
+
+import unittest
+from unittest import mock
+
+from tests.fakes import use_fake_redis
+from app import pokedex_data
+from app.pokeapi_client import NOT_FOUND
+
+class SummaryNotFoundTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        use_fake_redis()
+        self.requested = []
+        patcher = mock.patch.object(pokedex_data, "fetch_pokeapi", self._fetch_pokeapi)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _fetch_pokeapi(self, endpoint, client=None, revalidate=False, report_not_found=False):
+        self.requested.append(endpoint)
+        return NOT_FOUND if report_not_found else None
+
+    async def test_missing_id_is_fetched_once(self):
+        self.assertIsNone(await pokedex_data.get_pokemon_summary_data(9999))
+        self.assertIn("/pokemon/9999", self.requested)
+        self.requested.clear()
+
+        self.assertIsNone(await pokedex_data.get_pokemon_summary_data(9999))
+        self.assertIsNone(await pokedex_data.get_pokemon_detail_data("9999")) # Shares the negative cache entry
+        self.assertEqual(self.requested, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# backend/tests/test_summary_shards.py
+
+import unittest
+from unittest import mock
+
+from tests.fakes import use_fake_redis, clear_memos, summary_dict
+from app import cache
+from app import pokedex_data
+
+def _blocks(*blocks):
+    """Replacement for _iter_summary_blocks yielding the given blocks."""
+    async def iter_blocks(details=None):
+        for block in blocks:
+            yield block
+    return iter_blocks
+
+class SummaryShardRefreshTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.redis = use_fake_redis()
+        patcher = mock.patch.object(pokedex_data, "get_all_generations_data", mock.AsyncMock(return_value=[]))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _refresh(self, *blocks):
+        with mock.patch.object(pokedex_data, "_iter_summary_blocks", _blocks(*blocks)):
+            return await pokedex_data.get_pokedex_summary_data(force_refresh=True, raw=True)
+
+    async def _cached_ids(self):
+        clear_memos() # Read through Redis, as another instance would
+        summaries = await pokedex_data.get_pokedex_summary_data()
+        return [summary.id for summary in summaries]
+
+    async def test_interrupted_refresh_keeps_previous_summary(self):
+        await self._refresh([summary_dict(i) for i in range(1, 6)], [summary_dict(i) for i in range(6, 11)])
+        self.assertEqual(await self._cached_ids(), list(range(1, 11)))
+
+        manifest = await cache.get_cache(pokedex_data.POKEDEX_SUMMARY_MANIFEST_KEY)
+
+        # The first block of the next refresh is written, then the second fails validation
+        result = await self._refresh([summary_dict(i) for i in range(2, 7)], [{"id": "not-an-id"}])
+        self.assertIsNone(result)
+
+        self.assertEqual(await self._cached_ids(), list(range(1, 11)))
+        # The unpublished shard is left to expire shortly instead of living for the full cache TTL
+        abandoned_keys = [key for key in await self.redis.keys("*:shard:*") if manifest["refresh_id"].encode() not in key]
+        self.assertEqual(len(abandoned_keys), 1)
+        self.assertLessEqual(await self.redis.ttl(abandoned_keys[0]), pokedex_data.SUPERSEDED_SUMMARY_SHARDS_TTL_SECONDS)
+
+    async def test_reader_holding_old_manifest_reads_old_shard_set(self):
+        await self._refresh([summary_dict(1), summary_dict(2)], [summary_dict(3)])
+        old_manifest = await cache.get_cache(pokedex_data.POKEDEX_SUMMARY_MANIFEST_KEY)
+
+        await self._refresh([summary_dict(1, "-new")], [summary_dict(2, "-new"), summary_dict(3, "-new")])
+
+        old_shards = await cache.get_cache_shards(pokedex_data.POKEDEX_SUMMARY_CACHE_KEY, old_manifest["refresh_id"], old_manifest["shards"])
+        self.assertIsNotNone(old_shards)
+        old_summaries = pokedex_data._SUMMARY_LIST_ADAPTER.validate_json(pokedex_data._join_summary_shards(old_shards))
+        self.assertEqual([summary.name for summary in old_summaries], ["pokemon-1", "pokemon-2", "pokemon-3"])
+        # The superseded set is left to expire shortly instead of living for the full cache TTL
+        old_key = cache.shard_key(pokedex_data.POKEDEX_SUMMARY_CACHE_KEY, old_manifest["refresh_id"], 0)
+        self.assertLessEqual(await self.redis.ttl(old_key), pokedex_data.SUPERSEDED_SUMMARY_SHARDS_TTL_SECONDS)
+
+        clear_memos()
+        summaries = await pokedex_data.get_pokedex_summary_data()
+        self.assertEqual([summary.name for summary in summaries], ["pokemon-1-new", "pokemon-2-new", "pokemon-3-new"])
+
+    async def test_failed_shard_write_does_not_publish_manifest(self):
+        await self._refresh([summary_dict(1)])
+        manifest = await cache.get_cache(pokedex_data.POKEDEX_SUMMARY_MANIFEST_KEY)
+
+        with mock.patch.object(pokedex_data, "set_cache_shard", mock.AsyncMock(return_value=False)):
+            await self._refresh([summary_dict(1, "-new")])
+
+        self.assertEqual(await cache.get_cache(pokedex_data.POKEDEX_SUMMARY_MANIFEST_KEY), manifest)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ document.addEventListener('DOMContentLoaded', () => {
     let typesData = [];
     let currentDetailPokemon = null; // Keep track of which detail is shown
     let totalPokemonFetched = 0;
+    let generationCounts = {}; // Pokémon per generation_id, counted once after load
     let selectedGenerationId = ""; // Default to "" for "All"
 
     // --- Sprite Viewer State ---
@@ -115,6 +116,7 @@ document.addEventListener('DOMContentLoaded', () => {
             // If all successful and not maintenance:
             allPokemonData = summaryResult.value;
             totalPokemonFetched = allPokemonData.length;
+            generationCounts = countByGeneration(allPokemonData);
             generationsData = generationsResult.value.sort((a, b) => a.id - b.id);
             typesData = typesResult.value.sort((a, b) => a.name.localeCompare(b.name));
 
@@ -185,6 +187,15 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // --- Rendering Functions (Main List & Filters) ---
 
+    // Counts Pokémon per generation in a single pass over the list
+    function countByGeneration(pokemonList) {
+        const counts = {};
+        for (const p of pokemonList) {
+            counts[p.generation_id] = (counts[p.generation_id] || 0) + 1;
+        }
+        return counts;
+    }
+
     function populateGenerationButtons(generations) {
         generationButtonsContainer.innerHTML = ''; // Clear placeholder
 
@@ -203,9 +214,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
             const roman = formatGenerationId(gen.id).replace('Gen ', ''); // Get 'I', 'II' etc.
             const regionName = gen.region_name.charAt(0).toUpperCase() + gen.region_name.slice(1); // Capitalize region
-            // --- Calculate count for this specific generation ---
-            const count = allPokemonData.filter(p => p.generation_id === gen.id).length;
-            // --------------------------------------------------
+            const count = generationCounts[gen.id] || 0; // Precomputed, no scan per button
 
             button.textContent = `${regionName} - Gen ${roman} (${count})`;
             generationButtonsContainer.appendChild(button);
@@ -374,7 +383,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
         // Adjust potential total if a specific generation is selected
         if (selectedGeneration) {
-            potentialTotal = allPokemonData.filter(p => p.generation_id === parseInt(selectedGeneration)).length;
+            potentialTotal = generationCounts[parseInt(selectedGeneration)] || 0;
         }
         // Else (All Generations selected), potentialTotal remains totalPokemonFetched
 